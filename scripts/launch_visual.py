@@ -3,8 +3,11 @@
 Visual Interface Launcher for NeuralForge
 Choose between different visual interfaces
 """
+import os
+import signal
 import sys
 import subprocess
+import threading
 from pathlib import Path
 import argparse
 
@@ -22,32 +25,55 @@ def show_menu():
     print("0. 🚪 Exit")
     print()
 
-def launch_terminal_dashboard():
-    """Launch terminal dashboard"""
+def _exec(args):
+    """Replace the launcher process with the given command"""
+    # Buffered output is discarded by exec, so flush it first
+    sys.stdout.flush()
+    sys.stderr.flush()
+    os.execvp(args[0], args)
+
+def launch_terminal_dashboard(replace_process=False):
+    """Launch terminal dashboard
+    
+    With replace_process the launcher execs into the dashboard instead of
+    waiting on it as a child; use it when nothing else runs afterwards.
+    """
     print("🖥️  Launching Modern Terminal Dashboard...")
     script_path = Path(__file__).parent.parent / "src" / "visual" / "terminal_dashboard.py"
     if script_path.exists():
         try:
+            if replace_process:
+                _exec([sys.executable, str(script_path)])
             subprocess.run([sys.executable, str(script_path)], check=True)
-        except subprocess.CalledProcessError as e:
+        except (subprocess.CalledProcessError, OSError) as e:
             print(f"❌ Failed to launch terminal dashboard: {e}")
     else:
         print("❌ Terminal dashboard script not found")
 
-def launch_gui_dashboard():
-    """Launch GUI dashboard"""
+def launch_gui_dashboard(replace_process=False):
+    """Launch GUI dashboard
+    
+    With replace_process the launcher execs into the dashboard instead of
+    waiting on it as a child; use it when nothing else runs afterwards.
+    """
     print("🖼️  Launching GUI Dashboard...")
     script_path = Path(__file__).parent.parent / "src" / "visual" / "gui_dashboard.py"
     if script_path.exists():
         try:
+            if replace_process:
+                _exec([sys.executable, str(script_path)])
             subprocess.run([sys.executable, str(script_path)], check=True)
-        except subprocess.CalledProcessError as e:
+        except (subprocess.CalledProcessError, OSError) as e:
             print(f"❌ Failed to launch GUI dashboard: {e}")
     else:
         print("❌ GUI dashboard script not found")
 
-def launch_web_dashboard():
-    """Launch web dashboard"""
+def launch_web_dashboard(replace_process=False):
+    """Launch web dashboard
+    
+    With replace_process the launcher execs into the dev server instead of
+    waiting on it as a child; use it when nothing else runs afterwards.
+    """
     print("🌐 Launching Web Dashboard...")
     web_dir = Path(__file__).parent.parent / "web-dashboard"
     if web_dir.exists():
@@ -58,6 +84,9 @@ def launch_web_dashboard():
                 subprocess.run(["npm", "install"], cwd=web_dir, check=True)
             
             print("🚀 Starting development server...")
+            if replace_process:
+                os.chdir(web_dir)
+                _exec(["npm", "run", "dev"])
             subprocess.run(["npm", "run", "dev"], cwd=web_dir, check=True)
         except subprocess.CalledProcessError as e:
             print(f"❌ Failed to launch web dashboard: {e}")
@@ -73,26 +102,38 @@ def launch_mobile_web():
     print("📱 Mobile interface coming soon!")
     print("💡 For now, use the web dashboard on your mobile device")
 
+def _stop_process_group(process):
+    """Terminate a child started in its own session, including its descendants"""
+    try:
+        os.killpg(process.pid, signal.SIGTERM)
+    except (ProcessLookupError, PermissionError):
+        pass
+
 def launch_all_interfaces():
     """Launch all interfaces in demo mode"""
     print("🎯 Launching All Interfaces (Demo Mode)...")
     print("This will open all available interfaces for comparison.")
     print()
     
+    # Each child gets its own process group so it can be stopped as a whole
+    processes = []
+    
     # Launch terminal dashboard in background
     print("1. Starting Terminal Dashboard...")
-    terminal_process = subprocess.Popen([
+    processes.append(subprocess.Popen([
         sys.executable, 
         str(Path(__file__).parent.parent / "src" / "visual" / "terminal_dashboard.py")
-    ])
+    ], start_new_session=True,
+        bufsize=-1, stdout=sys.stdout, stderr=sys.stderr))
     
     # Launch GUI dashboard
     print("2. Starting GUI Dashboard...")
     try:
-        gui_process = subprocess.Popen([
+        processes.append(subprocess.Popen([
             sys.executable, 
             str(Path(__file__).parent.parent / "src" / "visual" / "gui_dashboard.py")
-        ])
+        ], start_new_session=True,
+            bufsize=-1, stdout=sys.stdout, stderr=sys.stderr))
     except Exception as e:
         print(f"❌ GUI Dashboard failed: {e}")
     
@@ -101,9 +142,10 @@ def launch_all_interfaces():
     try:
         web_dir = Path(__file__).parent.parent / "web-dashboard"
         if web_dir.exists():
-            web_process = subprocess.Popen([
+            processes.append(subprocess.Popen([
                 "npm", "run", "dev"
-            ], cwd=web_dir)
+            ], cwd=web_dir, start_new_session=True,
+                bufsize=-1, stdout=sys.stdout, stderr=sys.stderr))
         else:
             print("❌ Web dashboard not available")
     except Exception as e:
@@ -113,16 +155,12 @@ def launch_all_interfaces():
     print("Press Ctrl+C to stop all interfaces...")
     
     try:
-        # Wait for user to stop
-        while True:
-            pass
+        # Block until the user stops us, without spinning a CPU core
+        threading.Event().wait()
     except KeyboardInterrupt:
         print("\n🛑 Stopping all interfaces...")
-        terminal_process.terminate()
-        if 'gui_process' in locals():
-            gui_process.terminate()
-        if 'web_process' in locals():
-            web_process.terminate()
+        for process in processes:
+            _stop_process_group(process)
         print("✅ All interfaces stopped.")
 
 def main():
@@ -134,12 +172,13 @@ def main():
     args = parser.parse_args()
     
     if args.interface:
+        # Single-shot mode: nothing runs after the interface exits, so exec into it
         if args.interface == "terminal":
-            launch_terminal_dashboard()
+            launch_terminal_dashboard(replace_process=True)
         elif args.interface == "gui":
-            launch_gui_dashboard()
+            launch_gui_dashboard(replace_process=True)
         elif args.interface == "web":
-            launch_web_dashboard()
+            launch_web_dashboard(replace_process=True)
         elif args.interface == "mobile":
             launch_mobile_web()
         elif args.interface == "all":
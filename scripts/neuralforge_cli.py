@@ -26,6 +26,7 @@ Examples:
   neuralforge "schedule task for tomorrow"
   neuralforge "show analytics"
   neuralforge --interactive
+  cat commands.txt | neuralforge --stdin
         """
     )
     
@@ -41,6 +42,12 @@ Examples:
         help="Start interactive mode"
     )
     
+    parser.add_argument(
+        "--stdin",
+        action="store_true",
+        help="Read commands from stdin, one per line, in a single process"
+    )
+    
     parser.add_argument(
         "--help-commands",
         action="store_true",
@@ -57,6 +64,14 @@ Examples:
         print(interface.processor._get_help_message())
         return
     
+    # Batch mode: reuse one interface for every line instead of one process per command
+    if args.stdin:
+        for line in sys.stdin:
+            command = line.strip()
+            if command:
+                print(interface.chat(command))
+        return
+    
     # Interactive mode
     if args.interactive or not args.command:
         print("🧠 NeuralForge CLI - Interactive Mode")
@@ -3,17 +3,100 @@
 Document Tagger and Processor
 Intelligent document processing and tagging using NLTK
 """
+import heapq
 import os
 import re
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, FrozenSet, Iterator, List, Any, Optional, Tuple
 from datetime import datetime
 import json
 
+# Common words excluded from keyword extraction
+_COMMON_WORDS = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
+    'of', 'with', 'by', 'is', 'are', 'was', 'were', 'be', 'been', 'being',
+    'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could',
+    'should', 'may', 'might', 'must', 'can', 'this', 'that', 'these',
+    'those', 'i', 'you', 'he', 'she', 'it', 'we', 'they', 'me', 'him',
+    'her', 'us', 'them', 'my', 'your', 'his', 'her', 'its', 'our', 'their'
+})
+
+_WORD_RE = re.compile(r'\w+')
+# Words of three or more characters, the minimum length for a keyword
+_TOK_RE = re.compile(r'\w{3,}')
+_SENT_RE = re.compile(r'[.!?]+')
+
+def _tokenize(text: str) -> List[str]:
+    """Split text into lowercase word tokens"""
+    return _WORD_RE.findall(text.lower())
+
+def _analyze(text: str) -> Tuple[List[str], int]:
+    """Tokenize text and count sentences in a single pass over the content"""
+    tokens = _tokenize(text)
+    sentence_count = len(_SENT_RE.findall(text))
+    return tokens, sentence_count
+
+_READABILITY_LEVELS = ('easy', 'medium', 'hard')
+
+# Compact per-document result: (file_path, word_count, readability index, extension, tags)
+DocumentSummary = Tuple[str, int, int, str, Tuple[str, ...]]
+
+def _summary_from_result(file_path: str, doc_result: Dict[str, Any]) -> Optional[DocumentSummary]:
+    """Reduce a full document result to its DocumentSummary, or None on error"""
+    if 'error' in doc_result:
+        return None
+    return (
+        file_path,
+        doc_result['word_count'],
+        _READABILITY_LEVELS.index(doc_result['readability']),
+        os.path.splitext(file_path)[1].lower(),
+        tuple(doc_result['tags'])
+    )
+
+# Tagger instance installed in each worker process by _init_worker
+_worker_tagger: Optional["DocumentTagger"] = None
+
+def _init_worker(tagger: "DocumentTagger"):
+    """Install the parent's tagger in a worker process"""
+    global _worker_tagger
+    _worker_tagger = tagger
+
+def _process_document_worker(file_path: str,
+                             stat: Optional[os.stat_result] = None) -> Dict[str, Any]:
+    """Process a single document inside a worker process"""
+    return _worker_tagger.process_document(file_path, stat)
+
+def _summarize_document_worker(file_path: str,
+                               stat: Optional[os.stat_result] = None) -> Optional[DocumentSummary]:
+    """Summarize a single document inside a worker process"""
+    return _worker_tagger.summarize_document(file_path, stat)
+
+def _iter_files(root: str, file_extensions: FrozenSet[str]) -> Iterator[os.DirEntry]:
+    """Walk a directory tree with os.scandir, yielding matching file entries"""
+    stack = [root]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                        continue
+                    name = entry.name
+                    dot = name.rfind('.')
+                    # dot > 0 skips dotfiles, matching os.path.splitext
+                    if dot > 0 and name[dot:].lower() in file_extensions and entry.is_file():
+                        yield entry
+        except OSError:
+            continue
+
 class DocumentTagger:
     """Document processing and tagging system"""
     
-    def __init__(self):
+    def __init__(self, max_read_bytes: int = 2 * 1024 * 1024):
+        # Only the head of large files is read; it is enough for tagging
+        self.max_read_bytes = max_read_bytes
         self.tag_patterns = {
             'technical': ['api', 'code', 'programming', 'development', 'software', 'system'],
             'business': ['meeting', 'report', 'analysis', 'strategy', 'planning', 'budget'],
@@ -21,86 +104,99 @@ class DocumentTagger:
             'academic': ['research', 'study', 'paper', 'thesis', 'education', 'learning'],
             'creative': ['design', 'art', 'creative', 'writing', 'story', 'poem']
         }
+        self._category_sets = {
+            category: frozenset(keywords) for category, keywords in self.tag_patterns.items()
+        }
     
-    def extract_keywords(self, text: str, max_keywords: int = 10) -> List[str]:
-        """Extract keywords from text"""
+    def extract_keywords(self, text: str, max_keywords: int = 10,
+                         tokens: Optional[List[str]] = None) -> List[str]:
+        """Extract keywords from text, reusing precomputed tokens when given"""
         try:
-            # Simple keyword extraction
-            # Remove common words and extract meaningful terms
-            common_words = {
-                'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
-                'of', 'with', 'by', 'is', 'are', 'was', 'were', 'be', 'been', 'being',
-                'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could',
-                'should', 'may', 'might', 'must', 'can', 'this', 'that', 'these',
-                'those', 'i', 'you', 'he', 'she', 'it', 'we', 'they', 'me', 'him',
-                'her', 'us', 'them', 'my', 'your', 'his', 'her', 'its', 'our', 'their'
-            }
-            
-            # Clean and split text
-            text_clean = re.sub(r'[^\w\s]', ' ', text.lower())
-            words = text_clean.split()
+            # Count every token in C, then filter the distinct words; this keeps
+            # per-token Python work out of the loop for large documents
+            if tokens is None:
+                # The regex already drops words shorter than three characters
+                word_count = Counter(_TOK_RE.findall(text.lower()))
+            else:
+                word_count = Counter(tokens)
+                for word in [word for word in word_count if len(word) <= 2]:
+                    del word_count[word]
+            for word in _COMMON_WORDS:
+                word_count.pop(word, None)
             
-            # Filter and count words
-            word_count = {}
-            for word in words:
-                if len(word) > 2 and word not in common_words:
-                    word_count[word] = word_count.get(word, 0) + 1
-            
-            # Sort by frequency and return top keywords
-            sorted_words = sorted(word_count.items(), key=lambda x: x[1], reverse=True)
-            return [word for word, count in sorted_words[:max_keywords]]
+            # Return the most frequent keywords
+            return [word for word, count in word_count.most_common(max_keywords)]
         except Exception as e:
             return []
     
-    def generate_tags(self, text: str, title: str = "") -> List[str]:
-        """Generate relevant tags for document"""
+    def generate_tags(self, text: str, title: str = "",
+                      tokens: Optional[List[str]] = None) -> List[str]:
+        """Generate relevant tags for document, reusing precomputed tokens when given"""
         try:
-            tags = []
-            text_lower = text.lower()
-            title_lower = title.lower()
+            if tokens is None:
+                tokens = _tokenize(text)
             
-            # Check against tag patterns
-            for category, keywords in self.tag_patterns.items():
-                for keyword in keywords:
-                    if keyword in text_lower or keyword in title_lower:
-                        if category not in tags:
-                            tags.append(category)
+            # Check tag patterns by set intersection
+            token_set = set(tokens)
+            token_set.update(_tokenize(title))
+            tags = [
+                category for category, keywords in self._category_sets.items()
+                if token_set & keywords
+            ]
             
             # Add extracted keywords as tags
-            keywords = self.extract_keywords(text, 5)
+            keywords = self.extract_keywords(text, 5, tokens=tokens)
             tags.extend(keywords[:3])  # Add top 3 keywords
             
-            # Remove duplicates and return
-            return list(set(tags))
+            # Remove duplicates, keeping categories ahead of keywords
+            return list(dict.fromkeys(tags))
         except Exception as e:
             return []
     
-    def process_document(self, file_path: str) -> Dict[str, Any]:
-        """Process a document and extract metadata"""
+    def _decode(self, data: bytes, truncated: bool = False) -> str:
+        """Decode file bytes as UTF-8, falling back to latin-1 without re-reading"""
+        try:
+            return data.decode('utf-8')
+        except UnicodeDecodeError as e:
+            # A capped read may end in the middle of a multi-byte character
+            if truncated and e.start >= len(data) - 3:
+                try:
+                    return data[:e.start].decode('utf-8')
+                except UnicodeDecodeError:
+                    pass
+            return data.decode('latin-1')
+    
+    def process_document(self, file_path: str,
+                         stat: Optional[os.stat_result] = None) -> Dict[str, Any]:
+        """Process a document and extract metadata
+        
+        A stat result already obtained by the caller (e.g. from a directory walk)
+        can be passed in to avoid stat-ing the file again.
+        """
         try:
             path = Path(file_path)
-            if not path.exists():
-                return {'error': 'File does not exist'}
+            if stat is None:
+                if not path.exists():
+                    return {'error': 'File does not exist'}
+                stat = path.stat()
             
-            # Read file content
-            try:
-                with open(path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-            except UnicodeDecodeError:
-                with open(path, 'r', encoding='latin-1') as f:
-                    content = f.read()
+            # Read file content, capped at max_read_bytes
+            with open(path, 'rb', buffering=65536) as f:
+                data = f.read(self.max_read_bytes)
             
-            # Get file stats
-            stat = path.stat()
+            # Text files do not contain NUL bytes; skip binaries before tokenizing
+            if b'\x00' in data[:4096]:
+                return {'error': 'Binary file'}
+            content = self._decode(data, truncated=len(data) == self.max_read_bytes)
             
             # Extract metadata
             title = path.stem
-            keywords = self.extract_keywords(content)
-            tags = self.generate_tags(content, title)
+            tokens, sentence_count = _analyze(content)
+            keywords = self.extract_keywords(content, tokens=tokens)
+            tags = self.generate_tags(content, title, tokens=tokens)
             
             # Calculate readability score (simplified)
-            word_count = len(content.split())
-            sentence_count = len(re.findall(r'[.!?]+', content))
+            word_count = len(tokens)
             avg_words_per_sentence = word_count / max(sentence_count, 1)
             
             readability = "easy" if avg_words_per_sentence < 15 else "medium" if avg_words_per_sentence < 25 else "hard"
@@ -124,11 +220,46 @@ class DocumentTagger:
         except Exception as e:
             return {'error': str(e)}
     
-    def process_directory(self, directory: str, file_extensions: List[str] = None) -> Dict[str, Any]:
-        """Process all documents in a directory"""
+    def _load_cache(self, cache_path: str) -> Dict[str, Dict[str, Any]]:
+        """Load memoized document results from a JSON cache file"""
+        path = Path(cache_path)
+        if path.exists():
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+            except:
+                return {}
+        return {}
+    
+    def _save_cache(self, cache_path: str, cache: Dict[str, Dict[str, Any]]):
+        """Save memoized document results to a JSON cache file"""
+        with open(cache_path, 'w', encoding='utf-8') as f:
+            json.dump(cache, f, ensure_ascii=False)
+    
+    def summarize_document(self, file_path: str,
+                           stat: Optional[os.stat_result] = None) -> Optional[DocumentSummary]:
+        """Process a document, keeping only the fields used by directory summaries
+        
+        Returns None if the document could not be processed.
+        """
+        return _summary_from_result(file_path, self.process_document(file_path, stat))
+    
+    def process_directory(self, directory: str, file_extensions: List[str] = None,
+                          max_workers: Optional[int] = None,
+                          summary_only: bool = False,
+                          cache_path: Optional[str] = None) -> Dict[str, Any]:
+        """Process all documents in a directory using a pool of worker processes
+        
+        With summary_only, workers send back compact summaries instead of full
+        document results, and the 'documents' list is left empty.
+        
+        With cache_path, results are memoized in a JSON file keyed by path and
+        validated by mtime and size, so unchanged files are not re-processed.
+        """
         try:
             if file_extensions is None:
                 file_extensions = ['.txt', '.md', '.py', '.js', '.html', '.css', '.json']
+            extensions = frozenset(ext.lower() for ext in file_extensions)
             
             directory_path = Path(directory)
             if not directory_path.exists():
@@ -149,70 +280,136 @@ class DocumentTagger:
                 'processed_at': datetime.now().isoformat()
             }
             
-            # Process files
-            for file_path in directory_path.rglob('*'):
-                if file_path.is_file() and file_path.suffix.lower() in file_extensions:
-                    results['total_files'] += 1
+            # Collect files up front so they can be dispatched to workers
+            file_paths = []
+            file_stats = []
+            for entry in _iter_files(str(directory_path), extensions):
+                file_paths.append(entry.path)
+                file_stats.append(entry.stat())
+            results['total_files'] = len(file_paths)
+            
+            # Look up unchanged files in the cache; only the rest are processed
+            cache = self._load_cache(cache_path) if cache_path else None
+            cached_results = []
+            pending_paths = []
+            pending_stats = []
+            for file_path, stat in zip(file_paths, file_stats):
+                cached = cache.get(file_path) if cache is not None else None
+                if (cached is not None and cached.get('mtime_ns') == stat.st_mtime_ns
+                        and cached.get('size') == stat.st_size):
+                    cached_results.append(cached['result'])
+                else:
+                    cached_results.append(None)
+                    pending_paths.append(file_path)
+                    pending_stats.append(stat)
+            
+            # Full results are needed to fill the cache
+            use_summaries = summary_only and cache is None
+            
+            # Process files; small batches are not worth the pool start-up cost
+            if max_workers == 1 or len(pending_paths) < 2:
+                process = self.summarize_document if use_summaries else self.process_document
+                doc_results = map(process, pending_paths, pending_stats)
+                executor = None
+            else:
+                executor = ProcessPoolExecutor(
+                    max_workers=max_workers or os.cpu_count(),
+                    initializer=_init_worker,
+                    initargs=(self,)
+                )
+                worker = _summarize_document_worker if use_summaries else _process_document_worker
+                doc_results = executor.map(worker, pending_paths, pending_stats, chunksize=32)
+            
+            summary = results['summary']
+            file_types = Counter()
+            readability_counts = Counter()
+            try:
+                for file_path, stat, cached in zip(file_paths, file_stats, cached_results):
+                    doc_result = cached if cached is not None else next(doc_results)
                     
-                    doc_result = self.process_document(str(file_path))
-                    if 'error' in doc_result:
-                        results['failed_files'] += 1
+                    if use_summaries:
+                        doc_summary = doc_result
                     else:
-                        results['processed_files'] += 1
-                        results['documents'].append(doc_result)
-                        
-                        # Update summary
-                        results['summary']['total_words'] += doc_result['word_count']
-                        results['summary']['total_tags'].update(doc_result['tags'])
-                        
-                        # File type distribution
-                        ext = file_path.suffix.lower()
-                        if ext in results['summary']['file_types']:
-                            results['summary']['file_types'][ext] += 1
-                        else:
-                            results['summary']['file_types'][ext] = 1
-                        
-                        # Readability distribution
-                        readability = doc_result['readability']
-                        results['summary']['readability_distribution'][readability] += 1
+                        doc_summary = _summary_from_result(file_path, doc_result)
+                        if doc_summary is not None:
+                            if cache is not None:
+                                cache[file_path] = {
+                                    'mtime_ns': stat.st_mtime_ns,
+                                    'size': stat.st_size,
+                                    'result': doc_result
+                                }
+                            if not summary_only:
+                                results['documents'].append(doc_result)
+                    
+                    if doc_summary is None:
+                        results['failed_files'] += 1
+                        continue
+                    _, word_count, readability_idx, ext, tags = doc_summary
+                    readability = _READABILITY_LEVELS[readability_idx]
+                    
+                    # Update summary
+                    results['processed_files'] += 1
+                    summary['total_words'] += word_count
+                    summary['total_tags'].update(tags)
+                    file_types[ext] += 1
+                    readability_counts[readability] += 1
+            finally:
+                if executor is not None:
+                    executor.shutdown()
+            
+            summary['file_types'] = dict(file_types)
+            summary['readability_distribution'].update(readability_counts)
             
             # Convert set to list for JSON serialization
-            results['summary']['total_tags'] = list(results['summary']['total_tags'])
+            summary['total_tags'] = list(summary['total_tags'])
+            
+            if cache is not None:
+                self._save_cache(cache_path, cache)
             
             return results
         except Exception as e:
             return {'error': str(e)}
     
-    def search_documents(self, documents: List[Dict], query: str) -> List[Dict]:
-        """Search through processed documents"""
+    def build_index(self, documents: List[Dict]) -> Dict[str, List[Tuple[int, int]]]:
+        """Build an inverted index of field value -> (document index, weight) postings
+        
+        Titles weigh 3, keywords 2 and tags 1. Build it once and pass it to
+        search_documents when running several queries over the same documents.
+        """
+        index = {}
+        for doc_idx, doc in enumerate(documents):
+            index.setdefault(doc.get('title', '').lower(), []).append((doc_idx, 3))
+            for keyword in doc.get('keywords', []):
+                index.setdefault(keyword.lower(), []).append((doc_idx, 2))
+            for tag in doc.get('tags', []):
+                index.setdefault(tag.lower(), []).append((doc_idx, 1))
+        return index
+    
+    def search_documents(self, documents: List[Dict], query: str,
+                         index: Optional[Dict[str, List[Tuple[int, int]]]] = None,
+                         top_n: int = 20) -> List[Dict]:
+        """Search through processed documents, returning the top_n most relevant"""
         try:
+            if index is None:
+                index = self.build_index(documents)
+            
             query_lower = query.lower()
-            results = []
             
-            for doc in documents:
-                score = 0
-                
-                # Search in title
-                if query_lower in doc.get('title', '').lower():
-                    score += 3
-                
-                # Search in keywords
-                for keyword in doc.get('keywords', []):
-                    if query_lower in keyword.lower():
-                        score += 2
-                
-                # Search in tags
-                for tag in doc.get('tags', []):
-                    if query_lower in tag.lower():
-                        score += 1
-                
-                if score > 0:
-                    doc['relevance_score'] = score
-                    results.append(doc)
+            # Each distinct field value is only tested once, however many documents share it
+            scores = {}
+            for term, postings in index.items():
+                if query_lower in term:
+                    for doc_idx, weight in postings:
+                        scores[doc_idx] = scores.get(doc_idx, 0) + weight
             
-            # Sort by relevance score
-            results.sort(key=lambda x: x['relevance_score'], reverse=True)
-            return results
+            results = []
+            for doc_idx, score in sorted(scores.items()):
+                doc = documents[doc_idx]
+                doc['relevance_score'] = score
+                results.append(doc)
+            
+            # Select the best matches by relevance score
+            return heapq.nlargest(top_n, results, key=lambda x: x['relevance_score'])
         except Exception as e:
             return []
 
@@ -3,17 +3,65 @@
 AI Memory Buffer System with PostgreSQL Backend
 Advanced memory management for AI interactions
 """
+import csv
+import heapq
+import io
+import itertools
 import json
+import re
 import sqlite3
+import time
+from bisect import bisect_right
+from collections import Counter
+from contextlib import contextmanager
+from functools import lru_cache
+from operator import itemgetter
 import psycopg2
+from psycopg2.extras import Json, RealDictCursor, execute_values
+from psycopg2.pool import ThreadedConnectionPool
 from datetime import datetime
-from typing import Dict, List, Any, Optional, Union
+from typing import Dict, Iterator, List, Any, Optional, Union
 from pathlib import Path
 import os
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+def _json_loads(data: bytes) -> Any:
+    """Parse JSON bytes, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _json_dumps(obj: Any, indent: bool = False) -> bytes:
+    """Serialize an object to UTF-8 JSON bytes, using orjson when it is installed"""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False).encode('utf-8')
+
+class _Json(Json):
+    """psycopg2 JSON adapter that serializes with orjson when it is installed"""
+    
+    def dumps(self, obj: Any) -> str:
+        return _json_dumps(obj).decode('utf-8')
+
 class MemoryEntry:
     """Data model for memory entries"""
     
+    # No per-instance __dict__, which matters for large batch ingests
+    __slots__ = ('agent_name', 'task', 'response', 'success_rating', 'model_used',
+                 'tokens_used', 'metadata', 'ts', 'timestamp')
+    
     def __init__(self, agent_name: str, task: str, response: str, 
                  success_rating: int, model_used: str = "unknown", 
                  tokens_used: int = 0, metadata: Dict = None):
@@ -24,35 +72,253 @@ class MemoryEntry:
         self.model_used = model_used
         self.tokens_used = tokens_used
         self.metadata = metadata or {}
-        self.timestamp = datetime.now().isoformat()
+        # Integer nanoseconds for cheap comparisons, plus the ISO form for display
+        self.ts = time.time_ns()
+        self.timestamp = datetime.fromtimestamp(self.ts // 1_000_000_000).replace(
+            microsecond=self.ts // 1000 % 1_000_000).isoformat()
+
+def _timestamp_ns(timestamp: str) -> int:
+    """Convert an ISO-8601 timestamp to integer nanoseconds, 0 if it cannot be parsed"""
+    try:
+        parsed = datetime.fromisoformat(timestamp)
+    except (TypeError, ValueError):
+        return 0
+    return int(parsed.timestamp()) * 1_000_000_000 + parsed.microsecond * 1000
+
+class _LowercaseColumn:
+    """Lowercased copy of one text field across all memories, kept as a single string
+    
+    Values are joined with NUL separators so a substring search over every
+    memory is one str.find scan in C rather than a Python loop per memory.
+    """
+    
+    def __init__(self):
+        self._text = ''
+        self._pending = []
+        self._starts = []
+        self._length = 0
+    
+    def append(self, value: str):
+        """Add the next memory's value"""
+        value = value.lower()
+        self._starts.append(self._length)
+        self._pending.append(value)
+        self._length += len(value) + 1
+    
+    def _joined(self) -> str:
+        if self._pending:
+            pending = '\x00'.join(self._pending)
+            self._text = f"{self._text}\x00{pending}" if self._text else pending
+            self._pending = []
+        return self._text
+    
+    def _hits(self, locate) -> set:
+        """Collect memory indices from locate(start), which returns a match position or -1"""
+        starts = self._starts
+        hits = set()
+        pos = locate(0)
+        while pos >= 0 and starts:
+            index = bisect_right(starts, pos) - 1
+            hits.add(index)
+            if index + 1 >= len(starts):
+                break
+            # Resume at the next memory; one hit per memory is enough
+            pos = locate(starts[index + 1])
+        return hits
+    
+    def find(self, needle: str) -> set:
+        """Return the indices of memories whose value contains needle"""
+        text = self._joined()
+        starts = self._starts
+        if '\x00' in needle:
+            # A needle containing the separator could match across memories
+            ends = starts[1:] + [len(text) + 1]
+            return {i for i, (start, end) in enumerate(zip(starts, ends))
+                    if needle in text[start:end - 1]}
+        return self._hits(lambda start: text.find(needle, start))
+    
+    def find_any(self, needles: tuple) -> set:
+        """Return the indices of memories whose value contains any of needles"""
+        if len(needles) == 1 or any('\x00' in needle for needle in needles):
+            return set().union(*(self.find(needle) for needle in needles))
+        
+        text = self._joined()
+        search = _any_of(needles).search
+        
+        def locate(start):
+            match = search(text, start)
+            return match.start() if match else -1
+        
+        return self._hits(locate)
+
+@lru_cache(maxsize=256)
+def _any_of(needles: tuple) -> re.Pattern:
+    """Compile an alternation matching any of the (already lowercased) needles"""
+    return re.compile('|'.join(map(re.escape, needles)))
 
 class SimpleMemoryBuffer:
-    """Simple file-based memory storage"""
+    """Simple file-based memory storage
+    
+    Memories are stored as JSON Lines, one memory per line, so adding an
+    entry appends a single line instead of rewriting the whole file. A
+    storage path ending in .msgpack stores a stream of MessagePack objects
+    instead, which is smaller and faster to parse (requires msgpack).
+    """
     
-    def __init__(self, storage_path: str = "memory_storage.json"):
+    def __init__(self, storage_path: str = "memory_storage.json", fsync: bool = False):
         self.storage_path = Path(storage_path)
+        # fsync every write for durability across power loss, at the cost of latency
+        self.fsync = fsync
+        self._binary = self.storage_path.suffix == '.msgpack'
+        if self._binary and msgpack is None:
+            raise ImportError("msgpack is required for .msgpack memory storage")
+        self._fh = None
         self.memories = self._load_memories()
+        self._next_id = max((m.get('id', 0) for m in self.memories), default=0) + 1
+        
+        # Lowercased search columns, computed once per memory instead of per query
+        self._task_column = _LowercaseColumn()
+        self._response_column = _LowercaseColumn()
+        self._agent_column = _LowercaseColumn()
+        for memory in self.memories:
+            if 'ts' not in memory:
+                # Memories stored before integer timestamps were added
+                memory['ts'] = _timestamp_ns(memory.get('timestamp'))
+            self._index_memory(memory)
+        
+        # Ranked (index, score) pairs per (query, limit), cleared whenever a memory is added
+        self._ranked_cache = lru_cache(maxsize=256)(self._rank)
+    
+    def _index_memory(self, memory: Dict):
+        """Add a memory to the lowercased search columns"""
+        self._task_column.append(memory['task'])
+        self._response_column.append(memory['response'])
+        self._agent_column.append(memory['agent_name'])
     
     def _load_memories(self) -> List[Dict]:
         """Load memories from file"""
-        if self.storage_path.exists():
+        legacy_path = self.storage_path.with_suffix('.json')
+        if self._binary and not self.storage_path.exists() and legacy_path.exists():
+            # Migrate an existing JSON store to MessagePack once
             try:
-                with open(self.storage_path, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                memories = self._read_json_memories(legacy_path)
+                self._save_memories(memories)
+                return memories
             except:
                 return []
-        return []
+        
+        if not self.storage_path.exists():
+            return []
+        
+        try:
+            if self._binary:
+                return self._read_msgpack_memories(self.storage_path)
+            return self._read_json_memories(self.storage_path)
+        except:
+            return []
+    
+    def _read_json_memories(self, path: Path) -> List[Dict]:
+        """Read memories stored as JSON Lines or as a legacy JSON array"""
+        memories = []
+        with open(path, 'r+b') as f:
+            first_line = f.readline()
+            if first_line.lstrip().startswith(b'['):
+                # Legacy format: the whole file is a single JSON array
+                memories = _json_loads(first_line + f.read())
+                if path == self.storage_path:
+                    self._save_memories(memories)
+                return memories
+            
+            line = b''
+            parsed = False
+            # Chained rather than unpacked, so lines are read one at a time
+            for line in itertools.chain((first_line,), f):
+                parsed = False
+                if line.strip():
+                    try:
+                        memories.append(_json_loads(line))
+                        parsed = True
+                    except ValueError:
+                        # Skip a line torn by an interrupted write
+                        continue
+            
+            if line and not line.endswith(b'\n'):
+                # Every record ends with a newline; repair the tail so later
+                # appends start on a line of their own
+                if parsed:
+                    f.seek(0, os.SEEK_END)
+                    f.write(b'\n')
+                else:
+                    f.truncate(os.fstat(f.fileno()).st_size - len(line))
+        return memories
+    
+    def _read_msgpack_memories(self, path: Path) -> List[Dict]:
+        """Read memories stored as a stream of MessagePack objects"""
+        with open(path, 'r+b') as f:
+            unpacker = msgpack.Unpacker(f, raw=False, strict_map_key=False)
+            memories = []
+            end = 0
+            for memory in unpacker:
+                memories.append(memory)
+                end = unpacker.tell()
+            if end < os.fstat(f.fileno()).st_size:
+                # Drop an object torn by an interrupted write so later appends stay readable
+                f.truncate(end)
+        return memories
+    
+    def _encode_memory(self, memory: Dict) -> bytes:
+        """Serialize one memory in the storage file's format"""
+        if self._binary:
+            return msgpack.packb(memory, use_bin_type=True)
+        return _json_dumps(memory) + b'\n'
+    
+    def _save_memories(self, memories: Optional[List[Dict]] = None):
+        """Rewrite the whole storage file from memories
+        
+        The data is written to a temporary file that atomically replaces the
+        storage file, so a crash mid-write never leaves it half written.
+        """
+        if memories is None:
+            memories = self.memories
+        tmp_path = self.storage_path.with_name(self.storage_path.name + '.tmp')
+        with open(tmp_path, 'wb') as f:
+            f.write(b''.join(map(self._encode_memory, memories)))
+            if self.fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        # The append handle would keep writing to the replaced file
+        self.close()
+        os.replace(tmp_path, self.storage_path)
+    
+    def _append_memory(self, memory_dict: Dict):
+        """Append a single memory to the storage file"""
+        if self._fh is None:
+            self._fh = open(self.storage_path, 'ab', buffering=1 << 16)
+        self._fh.write(self._encode_memory(memory_dict))
+        self._fh.flush()
+        if self.fsync:
+            os.fsync(self._fh.fileno())
+    
+    def compact(self) -> bool:
+        """Rewrite the storage file from the loaded memories, dropping torn records"""
+        try:
+            self._save_memories()
+            return True
+        except Exception as e:
+            print(f"Error compacting memory storage: {e}")
+            return False
     
-    def _save_memories(self):
-        """Save memories to file"""
-        with open(self.storage_path, 'w', encoding='utf-8') as f:
-            json.dump(self.memories, f, indent=2, ensure_ascii=False)
+    def close(self):
+        """Close the storage file handle"""
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
     
     def add_memory_entry(self, entry: MemoryEntry) -> bool:
         """Add a memory entry"""
         try:
             memory_dict = {
-                'id': len(self.memories) + 1,
+                'id': self._next_id,
                 'agent_name': entry.agent_name,
                 'task': entry.task,
                 'response': entry.response,
@@ -60,36 +326,53 @@ class SimpleMemoryBuffer:
                 'model_used': entry.model_used,
                 'tokens_used': entry.tokens_used,
                 'metadata': entry.metadata,
-                'timestamp': entry.timestamp
+                'timestamp': entry.timestamp,
+                'ts': entry.ts
             }
+            self._append_memory(memory_dict)
             self.memories.append(memory_dict)
-            self._save_memories()
+            self._index_memory(memory_dict)
+            self._ranked_cache.cache_clear()
+            self._next_id += 1
             return True
         except Exception as e:
             print(f"Error adding memory entry: {e}")
             return False
     
+    def add_memory_entries(self, entries: List[MemoryEntry]) -> bool:
+        """Add many memory entries, returning False if any could not be added"""
+        results = [self.add_memory_entry(entry) for entry in entries]
+        return all(results)
+    
+    def _rank(self, query_lower: str, limit: int) -> tuple:
+        """Return the (index, score) pairs of the best matching memories"""
+        # A field matches when it contains any of the query's words
+        terms = tuple(dict.fromkeys(query_lower.split())) or (query_lower,)
+        
+        task_hits = self._task_column.find_any(terms)
+        response_hits = self._response_column.find_any(terms)
+        agent_hits = self._agent_column.find_any(terms)
+        
+        scored = []
+        for index in sorted(task_hits | response_hits | agent_hits):
+            score = 2 * (index in task_hits) + (index in response_hits) + (index in agent_hits)
+            scored.append((index, score / 4.0))
+        
+        # Select the top results by relevance score
+        return tuple(heapq.nlargest(limit, scored, key=itemgetter(1)))
+    
     def query_memory(self, query: str, limit: int = 10) -> List[Dict]:
         """Query memories by text search"""
         results = []
-        query_lower = query.lower()
-        
-        for memory in self.memories:
-            score = 0
-            if query_lower in memory['task'].lower():
-                score += 2
-            if query_lower in memory['response'].lower():
-                score += 1
-            if query_lower in memory['agent_name'].lower():
-                score += 1
-            
-            if score > 0:
-                memory['relevance_score'] = score / 4.0
-                results.append(memory)
-        
-        # Sort by relevance score
-        results.sort(key=lambda x: x['relevance_score'], reverse=True)
-        return results[:limit]
+        for index, score in self._ranked_cache(query.lower(), limit):
+            memory = self.memories[index]
+            memory['relevance_score'] = score
+            results.append(memory)
+        return results
+    
+    def has_entries(self) -> bool:
+        """Return True if any memory is stored"""
+        return bool(self.memories)
     
     def get_memory_stats(self) -> Dict[str, Any]:
         """Get memory system statistics"""
@@ -104,50 +387,116 @@ class SimpleMemoryBuffer:
             }
         
         total_entries = len(self.memories)
-        avg_rating = sum(m['success_rating'] for m in self.memories) / total_entries
-        total_tokens = sum(m['tokens_used'] for m in self.memories)
+        rating_sum = 0
+        total_tokens = 0
+        model_counts = Counter()
+        oldest = newest = self.memories[0]
         
-        models = [m['model_used'] for m in self.memories if m['model_used'] != 'unknown']
-        top_model = max(set(models), key=models.count) if models else 'none'
+        # Aggregate everything in a single pass over the memories, comparing
+        # integer timestamps rather than ISO strings
+        for m in self.memories:
+            rating_sum += m['success_rating']
+            total_tokens += m['tokens_used']
+            if m['model_used'] != 'unknown':
+                model_counts[m['model_used']] += 1
+            ts = m['ts']
+            if ts < oldest['ts']:
+                oldest = m
+            elif ts > newest['ts']:
+                newest = m
         
-        timestamps = [m['timestamp'] for m in self.memories]
-        date_range = {
-            'oldest': min(timestamps) if timestamps else None,
-            'newest': max(timestamps) if timestamps else None
-        }
+        avg_rating = rating_sum / total_entries
+        top_model = model_counts.most_common(1)[0][0] if model_counts else 'none'
         
         return {
             'total_entries': total_entries,
             'avg_success_rating': round(avg_rating, 2),
             'total_tokens_used': total_tokens,
             'top_model': top_model,
-            'models_used': list(set(models)),
-            'date_range': date_range
+            'models_used': list(model_counts),
+            'date_range': {'oldest': oldest['timestamp'], 'newest': newest['timestamp']}
         }
 
 class PostgreSQLMemoryBuffer:
     """PostgreSQL-based memory storage"""
     
-    def __init__(self, connection_params: Dict[str, str]):
+    INSERT_COLUMNS = (
+        "agent_name, task, response, success_rating, model_used, tokens_used, metadata, timestamp"
+    )
+    SELECT_COLUMNS = f"id, {INSERT_COLUMNS}"
+    
+    # The to_tsvector expressions must match the GIN index definitions exactly,
+    # otherwise the planner cannot use the indexes
+    FULL_TEXT_QUERY = f"""
+        SELECT {SELECT_COLUMNS},
+               2 * ts_rank_cd(to_tsvector('english', task), q)
+                 + ts_rank_cd(to_tsvector('english', response), q) AS relevance_score
+        FROM ai_memories, plainto_tsquery('english', %s) AS q
+        WHERE to_tsvector('english', task) @@ q OR to_tsvector('english', response) @@ q
+        ORDER BY relevance_score DESC
+        LIMIT %s
+    """
+    
+    # Substring fallback, served by the pg_trgm indexes when they exist
+    SUBSTRING_QUERY = f"""
+        SELECT {SELECT_COLUMNS},
+               ((CASE WHEN task ILIKE %(pattern)s THEN 2 ELSE 0 END)
+                + (CASE WHEN response ILIKE %(pattern)s THEN 1 ELSE 0 END)) / 3.0 AS relevance_score
+        FROM ai_memories
+        WHERE task ILIKE %(pattern)s OR response ILIKE %(pattern)s
+        ORDER BY relevance_score DESC, id
+        LIMIT %(limit)s
+    """
+    
+    def __init__(self, connection_params: Dict[str, str], min_connections: int = 1,
+                 max_connections: int = 8):
         self.connection_params = connection_params
-        self.connection = None
+        self.min_connections = min_connections
+        self.max_connections = max_connections
+        self.pool = None
     
     def connect(self):
-        """Connect to PostgreSQL database"""
+        """Open the connection pool, kept for the lifetime of the buffer"""
+        if self.pool is not None and not self.pool.closed:
+            return True
         try:
-            self.connection = psycopg2.connect(**self.connection_params)
+            self.pool = ThreadedConnectionPool(
+                self.min_connections, self.max_connections, **self.connection_params
+            )
             return True
         except Exception as e:
             print(f"PostgreSQL connection failed: {e}")
             return False
     
+    @contextmanager
+    def _conn(self) -> Iterator[Any]:
+        """Borrow a pooled connection, rolling back if the block fails"""
+        connection = self.pool.getconn()
+        try:
+            yield connection
+        except Exception:
+            if not connection.closed:
+                connection.rollback()
+            raise
+        finally:
+            self.pool.putconn(connection, close=bool(connection.closed))
+    
+    def close(self):
+        """Close all pooled connections"""
+        if self.pool is not None:
+            self.pool.closeall()
+            self.pool = None
+    
     def setup_database(self) -> bool:
-        """Setup database schema"""
+        """Setup database schema
+        
+        The connection pool is kept open on success so later operations reuse it.
+        """
         if not self.connect():
             return False
         
         try:
-            with self.connection.cursor() as cursor:
+            with self._conn() as connection, connection.cursor() as cursor:
                 cursor.execute("""
                     CREATE TABLE IF NOT EXISTS ai_memories (
                         id SERIAL PRIMARY KEY,
@@ -172,14 +521,161 @@ class PostgreSQLMemoryBuffer:
                     ON ai_memories USING gin(to_tsvector('english', response))
                 """)
                 
-                self.connection.commit()
+                # Trigram indexes for substring search; the extension needs
+                # privileges the database user may not have, so they are optional
+                cursor.execute("SAVEPOINT trigram_indexes")
+                try:
+                    cursor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+                    cursor.execute("""
+                        CREATE INDEX IF NOT EXISTS idx_ai_memories_task_trgm
+                        ON ai_memories USING gin(task gin_trgm_ops)
+                    """)
+                    cursor.execute("""
+                        CREATE INDEX IF NOT EXISTS idx_ai_memories_response_trgm
+                        ON ai_memories USING gin(response gin_trgm_ops)
+                    """)
+                except psycopg2.Error as e:
+                    print(f"Trigram indexes unavailable: {e}")
+                    cursor.execute("ROLLBACK TO SAVEPOINT trigram_indexes")
+                
+                connection.commit()
                 return True
         except Exception as e:
             print(f"Database setup failed: {e}")
+            self.close()
             return False
-        finally:
-            if self.connection:
-                self.connection.close()
+    
+    def add_memory_entry(self, entry: MemoryEntry) -> bool:
+        """Add a memory entry"""
+        return self.add_memory_entries([entry])
+    
+    def add_memory_entries(self, entries: List[MemoryEntry], use_copy: bool = False) -> bool:
+        """Add many memory entries in one transaction
+        
+        Rows are sent as multi-row INSERT statements of 1000 rows each with
+        execute_values instead of one round trip per row. With use_copy, the
+        batch is streamed through COPY, which is faster still for very large
+        batches.
+        """
+        if not entries:
+            return True
+        if not self.connect():
+            return False
+        
+        try:
+            with self._conn() as connection, connection.cursor() as cursor:
+                if use_copy:
+                    buffer = io.StringIO()
+                    # Quote every string so empty values stay '' rather than NULL
+                    writer = csv.writer(buffer, quoting=csv.QUOTE_NONNUMERIC)
+                    for e in entries:
+                        writer.writerow((e.agent_name, e.task, e.response, e.success_rating,
+                                         e.model_used, e.tokens_used,
+                                         _json_dumps(e.metadata).decode('utf-8'), e.timestamp))
+                    buffer.seek(0)
+                    cursor.copy_expert(
+                        f"COPY ai_memories ({self.INSERT_COLUMNS}) FROM STDIN WITH (FORMAT csv)",
+                        buffer
+                    )
+                else:
+                    rows = [
+                        (e.agent_name, e.task, e.response, e.success_rating,
+                         e.model_used, e.tokens_used, _Json(e.metadata), e.timestamp)
+                        for e in entries
+                    ]
+                    execute_values(
+                        cursor,
+                        f"INSERT INTO ai_memories ({self.INSERT_COLUMNS}) VALUES %s",
+                        rows,
+                        template="(%s, %s, %s, %s, %s, %s, %s, %s)",
+                        page_size=1000
+                    )
+                connection.commit()
+            return True
+        except Exception as e:
+            print(f"Error adding memory entries: {e}")
+            return False
+    
+    def has_entries(self) -> bool:
+        """Return True if any memory is stored, probing for one row instead of counting"""
+        if not self.connect():
+            return False
+        
+        try:
+            with self._conn() as connection, connection.cursor() as cursor:
+                cursor.execute("SELECT EXISTS (SELECT 1 FROM ai_memories)")
+                exists = cursor.fetchone()[0]
+                connection.commit()
+            return exists
+        except Exception as e:
+            print(f"Error checking memories: {e}")
+            return False
+
+    def query_memory(self, query: str, limit: int = 10) -> List[Dict]:
+        """Query memories with full-text search, falling back to substring matching"""
+        if not self.connect():
+            return []
+        
+        try:
+            with self._conn() as connection, \
+                    connection.cursor(cursor_factory=RealDictCursor) as cursor:
+                cursor.execute(self.FULL_TEXT_QUERY, (query, limit))
+                rows = cursor.fetchall()
+                if not rows:
+                    # Stop words and partial words never match a tsquery
+                    cursor.execute(self.SUBSTRING_QUERY, self._substring_params(query, limit))
+                    rows = cursor.fetchall()
+                connection.commit()
+            return [self._row_to_memory(row) for row in rows]
+        except Exception as e:
+            print(f"Error querying memories: {e}")
+            return []
+    
+    def iter_query_memory(self, query: str, limit: Optional[int] = None,
+                          itersize: int = 1000) -> Iterator[Dict]:
+        """Stream matching memories through a server-side cursor
+        
+        Rows are fetched itersize at a time instead of materializing the whole
+        result client-side, so large result sets (limit=None returns every
+        match) keep memory flat and the first rows arrive early.
+        """
+        if not self.connect():
+            return
+        
+        try:
+            with self._conn() as connection:
+                found = False
+                with connection.cursor(name='memory_query', cursor_factory=RealDictCursor) as cursor:
+                    cursor.itersize = itersize
+                    cursor.execute(self.FULL_TEXT_QUERY, (query, limit))
+                    for row in cursor:
+                        found = True
+                        yield self._row_to_memory(row)
+                
+                if not found:
+                    # Stop words and partial words never match a tsquery
+                    with connection.cursor(name='memory_query', cursor_factory=RealDictCursor) as cursor:
+                        cursor.itersize = itersize
+                        cursor.execute(self.SUBSTRING_QUERY, self._substring_params(query, limit))
+                        for row in cursor:
+                            yield self._row_to_memory(row)
+                connection.commit()
+        except Exception as e:
+            print(f"Error querying memories: {e}")
+    
+    @staticmethod
+    def _substring_params(query: str, limit: Optional[int]) -> Dict[str, Any]:
+        """Build SUBSTRING_QUERY parameters, escaping LIKE wildcards in the query"""
+        escaped = query.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+        return {'pattern': f"%{escaped}%", 'limit': limit}
+    
+    def _row_to_memory(self, row: Dict) -> Dict:
+        """Convert a database row to the dict shape used by SimpleMemoryBuffer"""
+        memory = dict(row)
+        if isinstance(memory.get('timestamp'), datetime):
+            memory['timestamp'] = memory['timestamp'].isoformat()
+        memory['relevance_score'] = float(memory['relevance_score'])
+        return memory
 
 class ConfigurableMemoryBuffer:
     """Main memory buffer with configurable backend"""
@@ -236,11 +732,23 @@ class ConfigurableMemoryBuffer:
                           model_used, tokens_used, metadata)
         return self.buffer.add_memory_entry(entry)
     
+    def add_memory_entries(self, entries: List[Dict]) -> bool:
+        """Add many memory entries at once
+        
+        Each entry is a dict of add_memory_entry's keyword arguments. The
+        PostgreSQL backend inserts them in a single transaction.
+        """
+        return self.buffer.add_memory_entries([MemoryEntry(**entry) for entry in entries])
+    
     def query_memory(self, query: str, limit: int = 10, 
                     min_relevance: float = 0.1) -> List[Dict]:
         """Query memories"""
         return self.buffer.query_memory(query, limit)
     
+    def has_entries(self) -> bool:
+        """Return True if any memory is stored, without computing statistics"""
+        return self.buffer.has_entries()
+    
     def get_memory_stats(self) -> Dict[str, Any]:
         """Get memory statistics"""
         return self.buffer.get_memory_stats()
@@ -1,8 +1,13 @@
 """
 Email automation module for NeuralForge
 """
+import copy
+import logging
+import queue
 import smtplib
+import time
 import email
+from concurrent.futures import ThreadPoolExecutor
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from email.mime.base import MIMEBase
@@ -12,6 +17,7 @@ from typing import List, Dict, Optional
 import os
 
 console = Console()
+logger = logging.getLogger(__name__)
 
 class EmailAutomation:
     """
@@ -31,47 +37,95 @@ class EmailAutomation:
         self.smtp_password = os.getenv("SMTP_PASSWORD")
         self.connection = None
     
+    def _open_connection(self) -> smtplib.SMTP:
+        """Open a new authenticated SMTP connection."""
+        connection = smtplib.SMTP(self.smtp_server, self.smtp_port)
+        connection.starttls()
+        connection.login(self.smtp_username, self.smtp_password)
+        return connection
+    
     def connect(self) -> bool:
         """Connect to SMTP server."""
         try:
-            self.connection = smtplib.SMTP(self.smtp_server, self.smtp_port)
-            self.connection.starttls()
-            self.connection.login(self.smtp_username, self.smtp_password)
+            self.connection = self._open_connection()
             console.print("[green]✅ Connected to SMTP server[/green]")
             return True
         except Exception as e:
             console.print(f"[red]❌ Failed to connect: {e}[/red]")
             return False
     
-    def send_email(self, to: str, subject: str, body: str, attachments: List[str] = None) -> bool:
+    def _build_attachment(self, file_path: str) -> Optional[MIMEBase]:
+        """Read and base64-encode a file as a MIME attachment part."""
+        if not os.path.isfile(file_path):
+            return None
+        with open(file_path, "rb") as attachment:
+            part = MIMEBase('application', 'octet-stream')
+            part.set_payload(attachment.read())
+        encoders.encode_base64(part)
+        part.add_header(
+            'Content-Disposition',
+            f'attachment; filename= {os.path.basename(file_path)}'
+        )
+        return part
+    
+    def _build_message(self, to: str, subject: str, body: str,
+                       attachments: List[str] = None,
+                       shared_parts: List[MIMEBase] = None) -> MIMEMultipart:
+        """Build a MIME message with optional file attachments.
+        
+        shared_parts are attachment parts already encoded by the caller; each
+        message gets its own shallow copy instead of re-reading and re-encoding.
+        """
+        msg = MIMEMultipart()
+        msg['From'] = self.smtp_username
+        msg['To'] = to
+        msg['Subject'] = subject
+        
+        msg.attach(MIMEText(body, 'plain'))
+        
+        # Add attachments
+        for part in shared_parts or []:
+            msg.attach(copy.copy(part))
+        for file_path in attachments or []:
+            part = self._build_attachment(file_path)
+            if part is not None:
+                msg.attach(part)
+        return msg
+    
+    def _send_message(self, connection: smtplib.SMTP, msg: MIMEMultipart) -> smtplib.SMTP:
+        """Send a message, reconnecting once if the server dropped the connection.
+        
+        Returns the connection to keep using, which is a new one after a reconnect.
+        """
+        try:
+            connection.send_message(msg)
+            return connection
+        except smtplib.SMTPServerDisconnected:
+            connection.close()
+            connection = self._open_connection()
+            try:
+                connection.send_message(msg)
+            except Exception:
+                # Do not leave a half-used retry connection open
+                connection.close()
+                raise
+            return connection
+    
+    @staticmethod
+    def _is_live(connection: Optional[smtplib.SMTP]) -> bool:
+        """Whether a connection is still open; smtplib clears sock when it closes"""
+        return connection is not None and connection.sock is not None
+    
+    def send_email(self, to: str, subject: str, body: str, attachments: List[str] = None,
+                   shared_parts: List[MIMEBase] = None) -> bool:
         """Send a single email."""
         if not self.connection:
             if not self.connect():
                 return False
         
         try:
-            msg = MIMEMultipart()
-            msg['From'] = self.smtp_username
-            msg['To'] = to
-            msg['Subject'] = subject
-            
-            msg.attach(MIMEText(body, 'plain'))
-            
-            # Add attachments
-            if attachments:
-                for file_path in attachments:
-                    if os.path.isfile(file_path):
-                        with open(file_path, "rb") as attachment:
-                            part = MIMEBase('application', 'octet-stream')
-                            part.set_payload(attachment.read())
-                            encoders.encode_base64(part)
-                            part.add_header(
-                                'Content-Disposition',
-                                f'attachment; filename= {os.path.basename(file_path)}'
-                            )
-                            msg.attach(part)
-            
-            self.connection.send_message(msg)
+            msg = self._build_message(to, subject, body, attachments, shared_parts)
+            self.connection = self._send_message(self.connection, msg)
             console.print(f"[green]✅ Email sent to {to}[/green]")
             return True
             
@@ -79,18 +133,88 @@ class EmailAutomation:
             console.print(f"[red]❌ Failed to send email: {e}[/red]")
             return False
     
-    def send_bulk_emails(self, recipients: List[Dict[str, str]], template: str) -> Dict[str, int]:
-        """Send bulk emails using template."""
+    def send_bulk_emails(self, recipients: List[Dict[str, str]], template: str,
+                         max_connections: int = 4,
+                         shared_attachments: List[str] = None) -> Dict[str, int]:
+        """Send bulk emails using template.
+        
+        Messages are sent by a pool of worker threads, each holding its own
+        SMTP connection, so network round trips overlap across connections.
+        shared_attachments are read and encoded once for the whole batch.
+        Per-message results go to the module logger; only the summary is printed.
+        """
         results = {"success": 0, "failed": 0}
+        started = time.perf_counter()
+        shared_parts = [
+            part for part in map(self._build_attachment, shared_attachments or [])
+            if part is not None
+        ]
+        pool_size = min(max_connections, len(recipients))
         
-        for recipient in recipients:
-            personalized_body = template.format(**recipient)
-            if self.send_email(recipient["email"], recipient["subject"], personalized_body):
-                results["success"] += 1
+        # A single connection gains nothing from the pool
+        if pool_size <= 1:
+            if not recipients or self.connection or self.connect():
+                for recipient in recipients:
+                    try:
+                        msg = self._build_message(
+                            recipient["email"], recipient["subject"], template.format(**recipient),
+                            shared_parts=shared_parts
+                        )
+                        self.connection = self._send_message(self.connection, msg)
+                        logger.debug("Email sent to %s", recipient["email"])
+                        results["success"] += 1
+                    except Exception as e:
+                        logger.warning("Failed to send email to %s: %s", recipient.get("email"), e)
+                        results["failed"] += 1
+            else:
+                results["failed"] = len(recipients)
+        else:
+            pool = queue.Queue()
+            for _ in range(pool_size):
+                try:
+                    pool.put(self._open_connection())
+                except Exception as e:
+                    console.print(f"[red]❌ Failed to connect: {e}[/red]")
+            
+            if pool.empty():
+                results["failed"] = len(recipients)
             else:
-                results["failed"] += 1
+                def send(recipient: Dict[str, str]) -> bool:
+                    connection = pool.get()
+                    try:
+                        # A slot whose connection died is reopened on next use
+                        if connection is None:
+                            connection = self._open_connection()
+                        msg = self._build_message(
+                            recipient["email"], recipient["subject"], template.format(**recipient),
+                            shared_parts=shared_parts
+                        )
+                        connection = self._send_message(connection, msg)
+                        logger.debug("Email sent to %s", recipient["email"])
+                        return True
+                    except Exception as e:
+                        logger.warning("Failed to send email to %s: %s", recipient.get("email"), e)
+                        return False
+                    finally:
+                        # Only a live connection goes back; a dead one leaves an empty slot
+                        pool.put(connection if self._is_live(connection) else None)
+                
+                with ThreadPoolExecutor(max_workers=pool.qsize()) as executor:
+                    for sent in executor.map(send, recipients):
+                        results["success" if sent else "failed"] += 1
+                
+                while not pool.empty():
+                    connection = pool.get()
+                    if connection is None:
+                        continue
+                    try:
+                        connection.quit()
+                    except Exception:
+                        pass
         
-        console.print(f"[blue]📊 Bulk email results: {results['success']} sent, {results['failed']} failed[/blue]")
+        elapsed = time.perf_counter() - started
+        console.print(f"[blue]📊 Bulk email results: {results['success']} sent, "
+                      f"{results['failed']} failed in {elapsed:.2f}s[/blue]")
         return results
     
     def disconnect(self):
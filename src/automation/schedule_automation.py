@@ -1,6 +1,7 @@
 """
 Schedule automation module for NeuralForge
 """
+import logging
 import schedule
 import time
 import threading
@@ -10,6 +11,7 @@ from typing import Callable, Dict, Any
 import json
 
 console = Console()
+logger = logging.getLogger(__name__)
 
 class ScheduleAutomation:
     """
@@ -26,6 +28,11 @@ class ScheduleAutomation:
         self.tasks = {}
         self.running = False
         self.scheduler_thread = None
+        self._jobs = {}
+        self._completed_runs = 0
+        self._failed_runs = 0
+        # Set to wake the scheduler thread early when the schedule changes
+        self._wakeup = threading.Event()
     
     def add_task(self, task_id: str, func: Callable, schedule_time: str, **kwargs) -> bool:
         """
@@ -39,13 +46,13 @@ class ScheduleAutomation:
         """
         try:
             if schedule_time == "daily":
-                schedule.every().day.at("00:00").do(self._execute_task, task_id, func, **kwargs)
+                job = schedule.every().day.at("00:00").do(self._execute_task, task_id, func, **kwargs)
             elif schedule_time == "weekly":
-                schedule.every().monday.do(self._execute_task, task_id, func, **kwargs)
+                job = schedule.every().monday.do(self._execute_task, task_id, func, **kwargs)
             elif schedule_time == "monthly":
-                schedule.every().month.do(self._execute_task, task_id, func, **kwargs)
+                job = schedule.every().month.do(self._execute_task, task_id, func, **kwargs)
             elif ":" in schedule_time:
-                schedule.every().day.at(schedule_time).do(self._execute_task, task_id, func, **kwargs)
+                job = schedule.every().day.at(schedule_time).do(self._execute_task, task_id, func, **kwargs)
             else:
                 console.print(f"[red]❌ Invalid schedule time: {schedule_time}[/red]")
                 return False
@@ -57,6 +64,8 @@ class ScheduleAutomation:
                 "status": "scheduled",
                 "kwargs": kwargs
             }
+            self._jobs[task_id] = job
+            self._wakeup.set()
             
             console.print(f"[green]✅ Task '{task_id}' scheduled for {schedule_time}[/green]")
             return True
@@ -66,9 +75,12 @@ class ScheduleAutomation:
             return False
     
     def _execute_task(self, task_id: str, func: Callable, **kwargs):
-        """Execute a scheduled task."""
+        """Execute a scheduled task.
+        
+        Runs are logged rather than printed; stop_scheduler prints a summary.
+        """
         try:
-            console.print(f"[blue]🔄 Executing task: {task_id}[/blue]")
+            logger.debug("Executing task: %s", task_id)
             self.tasks[task_id]["last_run"] = datetime.now()
             self.tasks[task_id]["status"] = "running"
             
@@ -76,11 +88,13 @@ class ScheduleAutomation:
             result = func(**kwargs)
             
             self.tasks[task_id]["status"] = "completed"
-            console.print(f"[green]✅ Task '{task_id}' completed successfully[/green]")
+            self._completed_runs += 1
+            logger.debug("Task %r completed successfully", task_id)
             
         except Exception as e:
             self.tasks[task_id]["status"] = "failed"
-            console.print(f"[red]❌ Task '{task_id}' failed: {e}[/red]")
+            self._failed_runs += 1
+            logger.warning("Task %r failed: %s", task_id, e)
     
     def start_scheduler(self):
         """Start the scheduler in background thread."""
@@ -94,17 +108,27 @@ class ScheduleAutomation:
         console.print("[green]✅ Scheduler started[/green]")
     
     def _run_scheduler(self):
-        """Run the scheduler loop."""
+        """Run the scheduler loop.
+        
+        Sleeps until the next job is due rather than polling, waking early
+        when tasks are added or removed or the scheduler is stopped.
+        """
         while self.running:
+            self._wakeup.clear()
             schedule.run_pending()
-            time.sleep(1)
+            idle_seconds = schedule.idle_seconds()
+            # Re-check at least once a minute in case the wall clock jumps (e.g. after sleep)
+            timeout = 60 if idle_seconds is None else min(max(idle_seconds, 0), 60)
+            self._wakeup.wait(timeout)
     
     def stop_scheduler(self):
         """Stop the scheduler."""
         self.running = False
+        self._wakeup.set()
         if self.scheduler_thread:
             self.scheduler_thread.join()
-        console.print("[yellow]⏹️ Scheduler stopped[/yellow]")
+        console.print(f"[yellow]⏹️ Scheduler stopped ({self._completed_runs} runs completed, "
+                      f"{self._failed_runs} failed)[/yellow]")
     
     def get_task_status(self, task_id: str = None) -> Dict[str, Any]:
         """Get status of tasks."""
@@ -115,7 +139,11 @@ class ScheduleAutomation:
     def remove_task(self, task_id: str) -> bool:
         """Remove a scheduled task."""
         if task_id in self.tasks:
+            job = self._jobs.pop(task_id, None)
+            if job is not None:
+                schedule.cancel_job(job)
             del self.tasks[task_id]
+            self._wakeup.set()
             console.print(f"[green]✅ Task '{task_id}' removed[/green]")
             return True
         else:
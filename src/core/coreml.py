@@ -6,9 +6,28 @@ PyTorch to Core ML model conversion and optimization
 import os
 import sys
 import time
-from typing import Dict, Any, Optional, Tuple
+from typing import Callable, Dict, Any, List, Optional, Tuple
 from pathlib import Path
 
+def _percentile(sorted_values: List[float], percent: float) -> float:
+    """Linearly interpolated percentile of an already sorted list"""
+    position = (len(sorted_values) - 1) * percent / 100
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (position - lower)
+
+def _latency_stats_ms(times_ns: List[int]) -> Dict[str, float]:
+    """Summarize integer nanosecond timings as millisecond statistics"""
+    times_ms = sorted(t / 1e6 for t in times_ns)
+    return {
+        'avg_inference_time_ms': sum(times_ms) / len(times_ms),
+        'min_time_ms': times_ms[0],
+        'max_time_ms': times_ms[-1],
+        'p50_time_ms': _percentile(times_ms, 50),
+        'p95_time_ms': _percentile(times_ms, 95),
+        'p99_time_ms': _percentile(times_ms, 99),
+    }
+
 class CoreMLConverter:
     """Convert PyTorch models to Core ML for Apple Silicon optimization"""
     
@@ -42,19 +61,25 @@ class CoreMLConverter:
             }
     
     def benchmark_model(self, model_path: str, 
-                       iterations: int = 100) -> Dict[str, Any]:
+                       iterations: int = 100,
+                       predict: Optional[Callable[[], Any]] = None) -> Dict[str, Any]:
         """Benchmark Core ML model performance"""
         try:
-            # Placeholder implementation
-            # In real implementation, would load and test the model
-            times = [0.045, 0.042, 0.048, 0.041, 0.043]  # Placeholder times
-            avg_time = sum(times) / len(times)
+            if predict is not None:
+                # Time each call in integer nanoseconds to avoid float rounding
+                times_ns = []
+                for _ in range(iterations):
+                    start = time.perf_counter_ns()
+                    predict()
+                    times_ns.append(time.perf_counter_ns() - start)
+            else:
+                # Placeholder implementation
+                # In real implementation, would load and test the model
+                times_ns = [45_000_000, 42_000_000, 48_000_000, 41_000_000, 43_000_000]  # Placeholder times
             
             return {
                 'success': True,
-                'avg_inference_time_ms': avg_time * 1000,
-                'min_time_ms': min(times) * 1000,
-                'max_time_ms': max(times) * 1000,
+                **_latency_stats_ms(times_ns),
                 'iterations': iterations,
                 'model_size_mb': 25.6,
                 'memory_usage_mb': 45.2,
@@ -168,6 +193,7 @@ def main():
     
     if benchmark_result['success']:
         print(f"⚡ Average inference time: {benchmark_result['avg_inference_time_ms']:.2f} ms")
+        print(f"📉 p95 inference time: {benchmark_result['p95_time_ms']:.2f} ms")
         print(f"💾 Memory usage: {benchmark_result['memory_usage_mb']:.1f} MB")
     else:
         print(f"❌ Benchmark failed: {benchmark_result['error']}")
@@ -3,32 +3,167 @@
 Intelligent File Organizer with wxPython GUI
 Smart file organization and management
 """
+import heapq
+import json
+import mmap
 import os
-import sys
 import shutil
+import time
+from contextlib import nullcontext
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import AbstractSet, Dict, Iterable, Iterator, List, Any, Optional, Tuple
 from datetime import datetime
+from itertools import repeat
 import hashlib
 
+_MB = 1024 * 1024
+_LARGE_FILE_BYTES = 100 * _MB
+_RECENT_SECONDS = 7 * 24 * 3600
+_HASH_CHUNK_BYTES = 1024 * 1024
+# Largest file hashed through mmap; bigger ones could exhaust a 32-bit address space
+_MMAP_MAX_BYTES = 2 * 1024 * _MB
+
+# Tool, cache and system directories that hold many files irrelevant to organizing
+IGNORED_DIRS = frozenset({
+    '__pycache__', 'node_modules', '.git', '.venv',
+    '.Spotlight-V100', '.Trashes', '.DocumentRevisions-V100', '.fseventsd'
+})
+
+# (path, name, stat) for one regular file
+FileRecord = Tuple[str, str, os.stat_result]
+
+def _scan_directory(path: str, ignore: AbstractSet[str] = frozenset(),
+                    skip_hidden: bool = False) -> Tuple[List[str], List[FileRecord]]:
+    """List one directory with os.scandir, returning its subdirectories and statted files
+    
+    Subdirectories named in ignore, or starting with '.' when skip_hidden is
+    set, are left out so the walk never descends into them.
+    """
+    subdirs = []
+    files = []
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                # d_type answers both checks on most filesystems without a stat call
+                if entry.is_dir(follow_symlinks=False):
+                    name = entry.name
+                    if name in ignore or (skip_hidden and name.startswith('.')):
+                        continue
+                    subdirs.append(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    # The one stat per file: DirEntry caches it (and on Windows it
+                    # comes free with the listing); size and mtime are read from it
+                    try:
+                        files.append((entry.path, entry.name, entry.stat(follow_symlinks=False)))
+                    except OSError:
+                        continue
+    except OSError:
+        pass
+    return subdirs, files
+
+def _walk_files(root: str, max_workers: int = 1, ignore: AbstractSet[str] = frozenset(),
+                skip_hidden: bool = False) -> Iterator[FileRecord]:
+    """Yield a FileRecord for every regular file under root
+    
+    With max_workers > 1, directories are scanned by a thread pool; scandir
+    and stat release the GIL, so metadata I/O overlaps across directories.
+    Ignored and hidden subdirectories are pruned as in _scan_directory.
+    """
+    if max_workers <= 1:
+        stack = [root]
+        while stack:
+            subdirs, files = _scan_directory(stack.pop(), ignore, skip_hidden)
+            stack.extend(subdirs)
+            yield from files
+        return
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = {executor.submit(_scan_directory, root, ignore, skip_hidden)}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                subdirs, files = future.result()
+                pending.update(executor.submit(_scan_directory, subdir, ignore, skip_hidden)
+                               for subdir in subdirs)
+                yield from files
+
+def _hash_file(path: str, algorithm: str = 'sha256') -> Optional[str]:
+    """Hash a file's contents, returning None if it cannot be read
+    
+    Files between 1 MiB and 2 GiB are memory-mapped and hashed straight from
+    the page cache; others, or any file that cannot be mapped, are read in
+    1 MiB chunks.
+    """
+    digest = hashlib.new(algorithm)
+    try:
+        with open(path, 'rb') as f:
+            if _HASH_CHUNK_BYTES < os.fstat(f.fileno()).st_size <= _MMAP_MAX_BYTES:
+                try:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                        if hasattr(mapped, 'madvise'):
+                            mapped.madvise(mmap.MADV_SEQUENTIAL)
+                        digest.update(mapped)
+                    return digest.hexdigest()
+                except (OSError, ValueError):
+                    digest = hashlib.new(algorithm)
+            while chunk := f.read(_HASH_CHUNK_BYTES):
+                digest.update(chunk)
+    except OSError:
+        return None
+    return digest.hexdigest()
+
 class FileOrganizer:
     """Core file organization logic"""
     
-    def __init__(self):
+    def __init__(self, hash_algorithm: str = 'sha256', ignore: Iterable[str] = IGNORED_DIRS,
+                 skip_hidden: bool = True):
+        # SHA-256 runs on dedicated CPU instructions on Apple Silicon and recent
+        # x86 (SHA-NI), outpacing MD5 and BLAKE2 there; any hashlib name works
+        hashlib.new(hash_algorithm)
+        self.hash_algorithm = hash_algorithm
+        # Directory names the analysis walk does not descend into
+        self.ignore = frozenset(ignore)
+        self.skip_hidden = skip_hidden
+        # Content hashes by path, reused while a file's size and mtime are unchanged
+        self._hash_cache: Dict[str, Dict[str, Any]] = {}
+        # Extension sets per category, for constant-time membership tests
         self.organize_rules = {
-            'images': ['.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff', '.webp'],
-            'documents': ['.pdf', '.doc', '.docx', '.txt', '.rtf', '.odt'],
-            'videos': ['.mp4', '.avi', '.mov', '.wmv', '.flv', '.mkv'],
-            'audio': ['.mp3', '.wav', '.flac', '.aac', '.ogg', '.m4a'],
-            'archives': ['.zip', '.rar', '.7z', '.tar', '.gz'],
-            'code': ['.py', '.js', '.html', '.css', '.java', '.cpp', '.c'],
-            'data': ['.csv', '.json', '.xml', '.yaml', '.yml'],
-            'presentations': ['.ppt', '.pptx', '.odp'],
-            'spreadsheets': ['.xls', '.xlsx', '.ods', '.csv']
+            'images': frozenset({'.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff', '.webp'}),
+            'documents': frozenset({'.pdf', '.doc', '.docx', '.txt', '.rtf', '.odt'}),
+            'videos': frozenset({'.mp4', '.avi', '.mov', '.wmv', '.flv', '.mkv'}),
+            'audio': frozenset({'.mp3', '.wav', '.flac', '.aac', '.ogg', '.m4a'}),
+            'archives': frozenset({'.zip', '.rar', '.7z', '.tar', '.gz'}),
+            'code': frozenset({'.py', '.js', '.html', '.css', '.java', '.cpp', '.c'}),
+            'data': frozenset({'.csv', '.json', '.xml', '.yaml', '.yml'}),
+            'presentations': frozenset({'.ppt', '.pptx', '.odp'}),
+            'spreadsheets': frozenset({'.xls', '.xlsx', '.ods', '.csv'})
         }
+        
+        # Flat extension lookup; the first category listing an extension wins,
+        # so '.csv' files go to 'data' rather than 'spreadsheets'
+        self._ext_to_category = {}
+        for category, extensions in self.organize_rules.items():
+            for ext in extensions:
+                self._ext_to_category.setdefault(ext, category)
     
-    def analyze_directory(self, directory: str) -> Dict[str, Any]:
-        """Analyze directory structure and file types"""
+    def analyze_directory(self, directory: str, max_workers: int = 8,
+                          output_path: Optional[str] = None,
+                          max_large_files: int = 100,
+                          cache_path: Optional[str] = None) -> Dict[str, Any]:
+        """Analyze directory structure and file types
+        
+        Directories are scanned by max_workers threads; pass 1 to walk serially.
+        Subdirectories in self.ignore, and hidden ones when self.skip_hidden is
+        set, are not descended into.
+        Only the max_large_files biggest large files are kept, largest first.
+        With output_path, every large and recent file is streamed there as a
+        JSON line instead, and recent_files is left empty to bound memory.
+        
+        Content hashes for duplicate detection are remembered between calls and,
+        with cache_path, persisted to a JSON file so later runs only hash files
+        whose size or modification time changed.
+        """
         try:
             path = Path(directory)
             if not path.exists():
@@ -42,72 +177,167 @@ class FileOrganizer:
                 'duplicates': [],
                 'large_files': [],
                 'recent_files': [],
+                # Top-level files by category, as organize_files would sort them
+                'categories': {},
                 'analysis_time': datetime.now().isoformat()
             }
             
-            for file_path in path.rglob('*'):
-                if file_path.is_file():
-                    analysis['total_files'] += 1
-                    file_size = file_path.stat().st_size
-                    analysis['total_size_mb'] += file_size / (1024 * 1024)
+            # Walk the tree once, statting each file once; duplicate detection
+            # reuses the collected (path, size, mtime_ns) records
+            recent_after = time.time() - _RECENT_SECONDS
+            root = str(path)
+            total_bytes = 0
+            file_types = analysis['file_types']
+            ext_to_category = self._ext_to_category
+            top_level = {}
+            largest = []  # min-heap of (size, path), bounded to max_large_files
+            files = []
+            with open(output_path, 'w', encoding='utf-8', buffering=1 << 16) \
+                    if output_path else nullcontext() as output:
+                for file_path, name, stat in _walk_files(root, max_workers, self.ignore,
+                                                         self.skip_hidden):
+                    file_size = stat.st_size
+                    total_bytes += file_size
                     
                     # File type analysis
-                    ext = file_path.suffix.lower()
-                    if ext in analysis['file_types']:
-                        analysis['file_types'][ext] += 1
-                    else:
-                        analysis['file_types'][ext] = 1
+                    ext = os.path.splitext(name)[1].lower()
+                    file_types[ext] = file_types.get(ext, 0) + 1
                     
                     # Large files (>100MB)
-                    if file_size > 100 * 1024 * 1024:
-                        analysis['large_files'].append({
-                            'path': str(file_path),
-                            'size_mb': file_size / (1024 * 1024)
-                        })
+                    if file_size > _LARGE_FILE_BYTES:
+                        if output is not None:
+                            output.write(json.dumps({'type': 'large', 'path': file_path,
+                                                     'size_mb': file_size / _MB}) + '\n')
+                        if len(largest) < max_large_files:
+                            heapq.heappush(largest, (file_size, file_path))
+                        elif largest and file_size > largest[0][0]:
+                            heapq.heapreplace(largest, (file_size, file_path))
+                    
+                    # Recent files (last 7 days); only these pay for a datetime
+                    if stat.st_mtime > recent_after:
+                        record = {
+                            'path': file_path,
+                            'modified': datetime.fromtimestamp(stat.st_mtime).isoformat()
+                        }
+                        if output is not None:
+                            output.write(json.dumps({'type': 'recent', **record}) + '\n')
+                        else:
+                            analysis['recent_files'].append(record)
+                    
+                    if os.path.dirname(file_path) == root:
+                        # Reuse the extension computed above rather than splitting again
+                        category = ext_to_category.get(ext)
+                        if category:
+                            count, size = top_level.get(category, (0, 0))
+                            top_level[category] = (count + 1, size + file_size)
                     
-                    # Recent files (last 7 days)
-                    file_mtime = file_path.stat().st_mtime
-                    if (datetime.now().timestamp() - file_mtime) < 7 * 24 * 3600:
-                        analysis['recent_files'].append({
-                            'path': str(file_path),
-                            'modified': datetime.fromtimestamp(file_mtime).isoformat()
-                        })
+                    files.append((file_path, file_size, stat.st_mtime_ns))
+            
+            analysis['large_files'] = [
+                {'path': file_path, 'size_mb': size / _MB}
+                for size, file_path in sorted(largest, reverse=True)
+            ]
+            analysis['total_files'] = len(files)
+            analysis['total_size_mb'] = total_bytes / _MB
+            analysis['categories'] = {
+                category: {'count': count, 'size_mb': size / _MB}
+                for category, (count, size) in top_level.items()
+            }
             
-            # Find duplicates by size and name
-            analysis['duplicates'] = self._find_duplicates(directory)
+            # Find files with identical contents
+            if cache_path:
+                self._hash_cache.update(self._load_hash_cache(cache_path))
+            analysis['duplicates'] = self._find_duplicates(files, max_workers)
+            if cache_path:
+                self._save_hash_cache(cache_path)
             
             return analysis
         except Exception as e:
             return {'error': str(e)}
     
-    def _find_duplicates(self, directory: str) -> List[Dict[str, Any]]:
-        """Find duplicate files"""
-        try:
-            file_hashes = {}
-            duplicates = []
-            
-            for file_path in Path(directory).rglob('*'):
-                if file_path.is_file():
-                    try:
-                        # Simple hash by file size and name
-                        file_hash = hashlib.md5(
-                            f"{file_path.name}{file_path.stat().st_size}".encode()
-                        ).hexdigest()
-                        
-                        if file_hash in file_hashes:
-                            duplicates.append({
-                                'hash': file_hash,
-                                'files': [str(file_hashes[file_hash]), str(file_path)],
-                                'size_mb': file_path.stat().st_size / (1024 * 1024)
-                            })
-                        else:
-                            file_hashes[file_hash] = file_path
-                    except:
-                        continue
-            
-            return duplicates
-        except:
-            return []
+    def _load_hash_cache(self, cache_path: str) -> Dict[str, Dict[str, Any]]:
+        """Load remembered content hashes from a JSON cache file"""
+        path = Path(cache_path)
+        if path.exists():
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    cache = json.load(f)
+                # Hashes from another algorithm cannot be compared
+                if cache.get('algorithm') == self.hash_algorithm:
+                    return cache['files']
+            except:
+                return {}
+        return {}
+    
+    def _save_hash_cache(self, cache_path: str):
+        """Save remembered content hashes to a JSON cache file"""
+        with open(cache_path, 'w', encoding='utf-8') as f:
+            json.dump({'algorithm': self.hash_algorithm, 'files': self._hash_cache}, f,
+                      ensure_ascii=False)
+    
+    def _find_duplicates(self, files: List[Tuple[str, int, int]],
+                         max_workers: int = 1) -> List[Dict[str, Any]]:
+        """Find files with identical contents among (path, size, mtime_ns) records
+        
+        Only files that share their size with another file are hashed, by
+        max_workers threads; hashlib releases the GIL while hashing each chunk.
+        Each extra copy is reported paired with the first file seen with its contents.
+        """
+        by_size = {}
+        mtimes = {}
+        for file_path, size, mtime_ns in files:
+            # Empty files are trivially identical and not worth reporting
+            if size:
+                by_size.setdefault(size, []).append(file_path)
+                mtimes[file_path] = mtime_ns
+        
+        hashes = {}
+        candidates = []
+        # Reuse remembered hashes of files whose size and mtime are unchanged
+        for size, paths in by_size.items():
+            if len(paths) < 2:
+                continue
+            for path in paths:
+                cached = self._hash_cache.get(path)
+                if (cached is not None and cached.get('mtime_ns') == mtimes[path]
+                        and cached.get('size') == size):
+                    hashes[path] = cached['hash']
+                else:
+                    candidates.append((path, size))
+        
+        paths = [path for path, _ in candidates]
+        if max_workers > 1 and len(paths) > 1:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                new_hashes = list(executor.map(_hash_file, paths, repeat(self.hash_algorithm)))
+        else:
+            new_hashes = [_hash_file(path, self.hash_algorithm) for path in paths]
+        
+        for (path, size), file_hash in zip(candidates, new_hashes):
+            hashes[path] = file_hash
+            if file_hash is not None:
+                self._hash_cache[path] = {
+                    'size': size, 'mtime_ns': mtimes[path], 'hash': file_hash
+                }
+        
+        duplicates = []
+        for size, paths in by_size.items():
+            if len(paths) < 2:
+                continue
+            seen = {}
+            for file_path in paths:
+                file_hash = hashes[file_path]
+                if file_hash is None:
+                    continue
+                if file_hash in seen:
+                    duplicates.append({
+                        'hash': file_hash,
+                        'files': [seen[file_hash], file_path],
+                        'size_mb': size / _MB
+                    })
+                else:
+                    seen[file_hash] = file_path
+        
+        return duplicates
     
     def organize_files(self, source_dir: str, target_dir: str, 
                       dry_run: bool = True) -> Dict[str, Any]:
@@ -133,64 +363,76 @@ class FileOrganizer:
                 'operations': []
             }
             
-            for file_path in source_path.iterdir():
-                if file_path.is_file():
-                    results['files_processed'] += 1
-                    
-                    # Determine category
-                    category = self._get_file_category(file_path)
-                    if category:
-                        target_category_dir = target_path / category
+            # List the entries up front since files are moved out of the directory
+            with os.scandir(source_path) as entries:
+                file_entries = [entry for entry in entries if entry.is_file()]
+            
+            # A plain rename suffices when both trees are on the same filesystem
+            same_device = os.stat(source_path).st_dev == os.stat(target_path).st_dev
+            # Names present in each category directory, listed once and kept up to
+            # date in memory so conflicts are resolved without exists() calls.
+            # Names are casefolded, since on a case-insensitive filesystem such as
+            # APFS "report.pdf" would replace an existing "Report.PDF"
+            taken_names = {}
+            
+            for entry in file_entries:
+                file_path = entry.path
+                results['files_processed'] += 1
+                
+                # Determine category
+                category = self._get_file_category(entry.name)
+                if category:
+                    target_category_dir = target_path / category
+                    names = taken_names.get(category)
+                    if names is None:
                         target_category_dir.mkdir(exist_ok=True)
-                        
-                        target_file_path = target_category_dir / file_path.name
-                        
-                        # Handle name conflicts
-                        counter = 1
-                        original_target = target_file_path
-                        while target_file_path.exists():
-                            stem = original_target.stem
-                            suffix = original_target.suffix
-                            target_file_path = target_category_dir / f"{stem}_{counter}{suffix}"
-                            counter += 1
-                        
-                        operation = {
-                            'source': str(file_path),
-                            'target': str(target_file_path),
-                            'category': category
-                        }
-                        
-                        if not dry_run:
-                            try:
+                        with os.scandir(target_category_dir) as existing:
+                            names = taken_names[category] = {e.name.casefold() for e in existing}
+                    
+                    # Handle name conflicts
+                    target_name = entry.name
+                    stem, suffix = os.path.splitext(target_name)
+                    counter = 1
+                    while target_name.casefold() in names:
+                        target_name = f"{stem}_{counter}{suffix}"
+                        counter += 1
+                    names.add(target_name.casefold())
+                    target_file_path = target_category_dir / target_name
+                    
+                    operation = {
+                        'source': str(file_path),
+                        'target': str(target_file_path),
+                        'category': category
+                    }
+                    
+                    if not dry_run:
+                        try:
+                            if same_device:
+                                os.rename(file_path, target_file_path)
+                            else:
                                 shutil.move(str(file_path), str(target_file_path))
-                                results['files_moved'] += 1
-                                operation['status'] = 'moved'
-                            except Exception as e:
-                                results['files_skipped'] += 1
-                                operation['status'] = 'error'
-                                operation['error'] = str(e)
-                                results['errors'].append(str(e))
-                        else:
                             results['files_moved'] += 1
-                            operation['status'] = 'would_move'
-                        
-                        results['operations'].append(operation)
+                            operation['status'] = 'moved'
+                        except Exception as e:
+                            results['files_skipped'] += 1
+                            operation['status'] = 'error'
+                            operation['error'] = str(e)
+                            results['errors'].append(str(e))
                     else:
-                        results['files_skipped'] += 1
+                        results['files_moved'] += 1
+                        operation['status'] = 'would_move'
+                    
+                    results['operations'].append(operation)
+                else:
+                    results['files_skipped'] += 1
             
             return results
         except Exception as e:
             return {'error': str(e)}
     
-    def _get_file_category(self, file_path: Path) -> Optional[str]:
+    def _get_file_category(self, file_name: str) -> Optional[str]:
         """Get file category based on extension"""
-        ext = file_path.suffix.lower()
-        
-        for category, extensions in self.organize_rules.items():
-            if ext in extensions:
-                return category
-        
-        return None
+        return self._ext_to_category.get(os.path.splitext(file_name)[1].lower())
     
     def create_organization_plan(self, directory: str) -> Dict[str, Any]:
         """Create a plan for organizing files"""
@@ -202,21 +444,12 @@ class FileOrganizer:
             'directory': directory,
             'total_files': analysis['total_files'],
             'total_size_mb': round(analysis['total_size_mb'], 2),
-            'categories': {},
+            # Categorized during the analysis walk, so files are not listed again
+            'categories': analysis['categories'],
             'recommendations': [],
             'estimated_time_minutes': 0
         }
         
-        # Categorize files
-        for file_path in Path(directory).iterdir():
-            if file_path.is_file():
-                category = self._get_file_category(file_path)
-                if category:
-                    if category not in plan['categories']:
-                        plan['categories'][category] = {'count': 0, 'size_mb': 0}
-                    plan['categories'][category]['count'] += 1
-                    plan['categories'][category]['size_mb'] += file_path.stat().st_size / (1024 * 1024)
-        
         # Generate recommendations
         if analysis['duplicates']:
             plan['recommendations'].append(f"Found {len(analysis['duplicates'])} duplicate files")
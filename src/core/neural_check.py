@@ -6,31 +6,127 @@ Real-time monitoring of Apple Neural Engine performance
 import os
 import sys
 import time
+import plistlib
 import subprocess
+import threading
 import json
 from datetime import datetime
-from typing import Dict, Any, Optional
-import psutil
-from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
-from rich.live import Live
-from rich.layout import Layout
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict, Any, Optional, Tuple
 
-console = Console()
+# rich and psutil are imported where they are first needed, so --help and
+# modules that only reference NeuralEngineMonitor do not pay for them
+if TYPE_CHECKING:
+    from rich.console import Console
+    from rich.layout import Layout
+    from rich.text import Text
+
+@lru_cache(maxsize=None)
+def _hardware_profile() -> Optional[str]:
+    """Return system_profiler hardware output; it never changes, so it is probed once per process"""
+    try:
+        result = subprocess.run(
+            ['system_profiler', 'SPHardwareDataType'],
+            capture_output=True, text=True, timeout=5
+        )
+        if result.returncode == 0:
+            return result.stdout
+    except:
+        pass
+    return None
+
+def _gpu_usage_from_plist(data: bytes) -> Optional[float]:
+    """Parse GPU busy percentage from one powermetrics plist sample"""
+    try:
+        sample = plistlib.loads(data.strip(b'\x00\n'))
+        idle_ratio = sample['gpu']['idle_ratio']
+    except Exception:
+        return None
+    return (1 - idle_ratio) * 100
+
+class _PowermetricsSampler:
+    """Long-running powermetrics process whose samples are parsed on a background thread"""
+    
+    def __init__(self, interval_ms: int = 1000):
+        self.interval_ms = interval_ms
+        self.gpu_usage = None
+        self._process = None
+        self._thread = None
+    
+    @property
+    def running(self) -> bool:
+        return self._process is not None and self._process.poll() is None
+    
+    def start(self):
+        """Launch powermetrics, streaming one plist sample per interval"""
+        if self.running:
+            return
+        try:
+            self._process = subprocess.Popen(
+                ['powermetrics', '--samplers', 'gpu', '-i', str(self.interval_ms), '-f', 'plist'],
+                stdout=subprocess.PIPE, stderr=subprocess.DEVNULL
+            )
+        except OSError:
+            self._process = None
+            return
+        self._thread = threading.Thread(target=self._read_samples, daemon=True)
+        self._thread.start()
+    
+    def _read_samples(self):
+        # Samples are separated by NUL bytes
+        pending = b''
+        for chunk in iter(lambda: self._process.stdout.read1(65536), b''):
+            *samples, pending = (pending + chunk).split(b'\x00')
+            for sample in samples:
+                gpu_usage = _gpu_usage_from_plist(sample)
+                if gpu_usage is not None:
+                    self.gpu_usage = gpu_usage
+    
+    def stop(self):
+        """Terminate powermetrics and wait for the reader thread"""
+        if self._process is None:
+            return
+        if self._process.poll() is None:
+            self._process.terminate()
+            try:
+                self._process.wait(timeout=2)
+            except subprocess.TimeoutExpired:
+                self._process.kill()
+        self._thread.join(timeout=2)
+        self._process.stdout.close()
+        self._process = None
+        self._thread = None
 
 class NeuralEngineMonitor:
     """Monitor Apple Neural Engine performance in real-time"""
     
     def __init__(self):
-        self.console = Console()
+        self.console: Optional["Console"] = None
         self.running = False
+        # Set by stop_monitoring to wake the refresh loop without waiting out the interval
+        self._stop_event = threading.Event()
+        # Built by the first create_dashboard call and reused by every refresh
+        self._dashboard: Optional["Layout"] = None
+        # Streams GPU samples while start_monitoring runs
+        self._sampler = _PowermetricsSampler()
+        # Prime the CPU counters so later non-blocking reads cover the time since the previous call
+        import psutil
+        psutil.cpu_percent(interval=None)
+    
+    def _ensure_console(self) -> "Console":
+        """Create the rich console on first use"""
+        if self.console is None:
+            from rich.console import Console
+            self.console = Console()
+        return self.console
         
     def get_system_metrics(self) -> Dict[str, Any]:
         """Get current system metrics including Neural Engine data"""
+        import psutil
         try:
             # Basic system metrics
-            cpu_percent = psutil.cpu_percent(interval=1)
+            # Non-blocking: usage since the previous call, so a refresh never sleeps here
+            cpu_percent = psutil.cpu_percent(interval=None)
             memory = psutil.virtual_memory()
             disk = psutil.disk_usage('/')
             
@@ -54,44 +150,39 @@ class NeuralEngineMonitor:
     
     def _get_ane_power(self) -> Optional[float]:
         """Get Apple Neural Engine power usage"""
-        try:
-            # Try to get ANE power from system profiler
-            result = subprocess.run(
-                ['system_profiler', 'SPHardwareDataType'],
-                capture_output=True, text=True, timeout=5
-            )
-            if result.returncode == 0:
-                # Simplified - in real implementation, parse the output
-                return 15.2  # Placeholder value
-        except:
-            pass
+        # Try to get ANE power from system profiler
+        if _hardware_profile() is not None:
+            # Simplified - in real implementation, parse the output
+            return 15.2  # Placeholder value
         return None
     
     def _get_gpu_usage(self) -> Optional[float]:
         """Get GPU usage percentage"""
+        # While monitoring, read the latest streamed sample instead of spawning a process
+        if self._sampler.running:
+            return self._sampler.gpu_usage
         try:
             # Try to get GPU usage from powermetrics
             result = subprocess.run(
-                ['powermetrics', '--samplers', 'gpu', '-n', '1'],
-                capture_output=True, text=True, timeout=5
+                ['powermetrics', '--samplers', 'gpu', '-n', '1', '-f', 'plist'],
+                capture_output=True, timeout=5
             )
             if result.returncode == 0:
-                # Parse GPU usage from output
-                return 25.5  # Placeholder value
+                return _gpu_usage_from_plist(result.stdout)
         except:
             pass
         return None
     
-    def create_dashboard(self, metrics: Dict[str, Any]) -> Layout:
-        """Create a rich dashboard layout"""
-        layout = Layout()
+    def _build_dashboard(self) -> "Layout":
+        """Build the dashboard layout once, keeping the Text objects later frames rewrite"""
+        from rich.layout import Layout
+        from rich.panel import Panel
+        from rich.table import Table
+        from rich.text import Text
         
         # Header
-        header = Panel(
-            f"🧠 Neural Engine Monitor - Apple M3 iMac\n"
-            f"⏰ {metrics.get('timestamp', 'N/A')}",
-            style="bold blue"
-        )
+        self._header_text = Text()
+        header = Panel(self._header_text, style="bold blue")
         
         # System metrics table
         table = Table(title="System Metrics", show_header=True, header_style="bold magenta")
@@ -99,75 +190,117 @@ class NeuralEngineMonitor:
         table.add_column("Value", style="green")
         table.add_column("Status", style="yellow")
         
+        self._metric_cells = {}
+        for key, label in (('cpu', "CPU Usage"), ('memory', "Memory"),
+                           ('ane', "Neural Engine"), ('gpu', "GPU Usage")):
+            value, status = Text(), Text()
+            table.add_row(label, value, status)
+            self._metric_cells[key] = (value, status)
+        
+        layout = Layout()
+        layout.split_column(
+            Panel(header, style="bold blue"),
+            Panel(table, style="bold green")
+        )
+        
+        return layout
+    
+    def create_dashboard(self, metrics: Dict[str, Any]) -> "Layout":
+        """Update the rich dashboard layout with metrics and return it
+        
+        The layout is built on first use; later calls only rewrite cell texts,
+        so each refresh allocates a handful of strings rather than new widgets.
+        """
+        if self._dashboard is None:
+            self._dashboard = self._build_dashboard()
+        cells = self._metric_cells
+        
+        self._header_text.plain = (f"🧠 Neural Engine Monitor - Apple M3 iMac\n"
+                                   f"⏰ {metrics.get('timestamp', 'N/A')}")
+        
         # CPU
         cpu_val = metrics.get('cpu_percent', 0)
         cpu_status = "🟢" if cpu_val < 50 else "🟡" if cpu_val < 80 else "🔴"
-        table.add_row("CPU Usage", f"{cpu_val:.1f}%", cpu_status)
+        self._set_row(cells['cpu'], f"{cpu_val:.1f}%", cpu_status)
         
         # Memory
         mem_val = metrics.get('memory_percent', 0)
         mem_used = metrics.get('memory_used_gb', 0)
         mem_total = metrics.get('memory_total_gb', 0)
         mem_status = "🟢" if mem_val < 70 else "🟡" if mem_val < 90 else "🔴"
-        table.add_row("Memory", f"{mem_val:.1f}% ({mem_used:.1f}/{mem_total:.1f} GB)", mem_status)
+        self._set_row(cells['memory'], f"{mem_val:.1f}% ({mem_used:.1f}/{mem_total:.1f} GB)", mem_status)
         
         # Neural Engine
         ane_val = metrics.get('ane_power', 0)
         ane_status = "🟢" if ane_val and ane_val < 20 else "🟡" if ane_val and ane_val < 40 else "🔴"
-        table.add_row("Neural Engine", f"{ane_val:.1f}W" if ane_val else "N/A", ane_status)
+        self._set_row(cells['ane'], f"{ane_val:.1f}W" if ane_val else "N/A", ane_status)
         
         # GPU
         gpu_val = metrics.get('gpu_usage', 0)
         gpu_status = "🟢" if gpu_val and gpu_val < 30 else "🟡" if gpu_val and gpu_val < 60 else "🔴"
-        table.add_row("GPU Usage", f"{gpu_val:.1f}%" if gpu_val else "N/A", gpu_status)
+        self._set_row(cells['gpu'], f"{gpu_val:.1f}%" if gpu_val else "N/A", gpu_status)
         
-        layout.split_column(
-            Panel(header, style="bold blue"),
-            Panel(table, style="bold green")
-        )
-        
-        return layout
+        return self._dashboard
+    
+    @staticmethod
+    def _set_row(cells: Tuple["Text", "Text"], value: str, status: str):
+        """Rewrite the value and status cells of one metrics row in place"""
+        cells[0].plain = value
+        cells[1].plain = status
     
     def start_monitoring(self, refresh_rate: float = 1.0):
         """Start real-time monitoring"""
+        from rich.live import Live
+        
+        console = self._ensure_console()
         self.running = True
+        self._stop_event.clear()
         console.print("🧠 Starting Neural Engine Monitor...")
         console.print("Press Ctrl+C to stop")
         
+        self._sampler.start()
         try:
-            with Live(self.create_dashboard({}), refresh_per_second=1/refresh_rate) as live:
+            # Redraw only when new metrics arrive; ticks are scheduled from the
+            # start time so sampling and rendering do not stretch the interval
+            with Live(self.create_dashboard({}), console=console, auto_refresh=False) as live:
+                next_tick = time.monotonic()
                 while self.running:
-                    metrics = self.get_system_metrics()
-                    live.update(self.create_dashboard(metrics))
-                    time.sleep(refresh_rate)
+                    # The same layout is updated in place, so a refresh redraws it
+                    self.create_dashboard(self.get_system_metrics())
+                    live.refresh()
+                    next_tick += refresh_rate
+                    if self._stop_event.wait(max(0.0, next_tick - time.monotonic())):
+                        break
         except KeyboardInterrupt:
             console.print("\n🛑 Monitoring stopped by user")
         except Exception as e:
             console.print(f"❌ Error during monitoring: {e}")
         finally:
             self.running = False
+            self._sampler.stop()
     
     def stop_monitoring(self):
         """Stop monitoring"""
         self.running = False
+        self._stop_event.set()
 
 def main():
     """Main entry point"""
-    monitor = NeuralEngineMonitor()
-    
+    # Plain print keeps --help free of the rich and psutil imports
     if len(sys.argv) > 1 and sys.argv[1] == "--help":
-        console.print("🧠 Neural Engine Monitor for Apple M3")
-        console.print("Usage: python3 neural_check.py [--help]")
-        console.print("Features:")
-        console.print("  - Real-time CPU, Memory, Neural Engine monitoring")
-        console.print("  - Beautiful terminal dashboard")
-        console.print("  - Apple Silicon optimized")
+        print("🧠 Neural Engine Monitor for Apple M3")
+        print("Usage: python3 neural_check.py [--help]")
+        print("Features:")
+        print("  - Real-time CPU, Memory, Neural Engine monitoring")
+        print("  - Beautiful terminal dashboard")
+        print("  - Apple Silicon optimized")
         return
     
+    monitor = NeuralEngineMonitor()
     try:
         monitor.start_monitoring()
     except Exception as e:
-        console.print(f"❌ Failed to start monitoring: {e}")
+        monitor._ensure_console().print(f"❌ Failed to start monitoring: {e}")
 
 if __name__ == "__main__":
     main()
@@ -37,9 +37,12 @@ class ProjectsIntegration:
             "NeuralForge/Reports"
         ]
         
+        # Only leaves need a mkdir; creating them also creates their parents
+        parents = {str(Path(directory).parent) for directory in directories}
         for directory in directories:
             dir_path = self.projects_root / directory
-            dir_path.mkdir(parents=True, exist_ok=True)
+            if directory not in parents:
+                dir_path.mkdir(parents=True, exist_ok=True)
             print(f"✅ Created directory: {dir_path}")
     
     def create_project_readme(self):
@@ -176,8 +179,7 @@ export NEURALFORGE_LOGS="{self.projects_root}/NeuralForge/Logs"
 """
         
         readme_path = self.projects_root / "README.md"
-        with open(readme_path, 'w', encoding='utf-8') as f:
-            f.write(readme_content)
+        readme_path.write_bytes(readme_content.encode('utf-8'))
         
         print(f"✅ Created README: {readme_path}")
     
@@ -248,8 +250,7 @@ esac
 """
         
         launcher_path = self.projects_root / "launch_neuralforge.sh"
-        with open(launcher_path, 'w', encoding='utf-8') as f:
-            f.write(launcher_content)
+        launcher_path.write_bytes(launcher_content.encode('utf-8'))
         
         # Make executable
         os.chmod(launcher_path, 0o755)
@@ -264,8 +265,7 @@ cd "{self.projects_root}"
 """
         
         desktop_path = Path.home() / "Desktop" / "NeuralForge.command"
-        with open(desktop_path, 'w', encoding='utf-8') as f:
-            f.write(shortcut_content)
+        desktop_path.write_bytes(shortcut_content.encode('utf-8'))
         
         # Make executable
         os.chmod(desktop_path, 0o755)
@@ -290,8 +290,7 @@ alias neural-visual="cd {self.neuralforge_root} && python3 scripts/launch_visual
 """
         
         env_path = self.projects_root / "neuralforge.env"
-        with open(env_path, 'w', encoding='utf-8') as f:
-            f.write(env_content)
+        env_path.write_bytes(env_content.encode('utf-8'))
         
         print(f"✅ Created environment file: {env_path}")
         print("💡 Add 'source {}/neuralforge.env' to your ~/.zshrc or ~/.bashrc".format(env_path))
@@ -320,8 +319,8 @@ alias neural-visual="cd {self.neuralforge_root} && python3 scripts/launch_visual
             }
         }
         
-        with open(config_dir / "system_config.json", 'w') as f:
-            json.dump(system_config, f, indent=2)
+        (config_dir / "system_config.json").write_bytes(
+            json.dumps(system_config, indent=2).encode('utf-8'))
         
         # Automation configuration
         automation_config = {
@@ -341,8 +340,8 @@ alias neural-visual="cd {self.neuralforge_root} && python3 scripts/launch_visual
             }
         }
         
-        with open(config_dir / "automation_config.json", 'w') as f:
-            json.dump(automation_config, f, indent=2)
+        (config_dir / "automation_config.json").write_bytes(
+            json.dumps(automation_config, indent=2).encode('utf-8'))
         
         print(f"✅ Created configuration files in {config_dir}")
     
@@ -6,24 +6,69 @@ Connects PERSONA profiling with AI Memory System
 import os
 import sys
 import json
+import codecs
+import heapq
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from typing import Dict, FrozenSet, List, Any, Optional
 
-# Add parent directory to path for imports
-sys.path.append(str(Path(__file__).parent.parent))
+# Run as a script, this directory rather than src/ is on sys.path; imported
+# as integration.system_integration, src/ is importable already
+if not __package__:
+    sys.path.append(str(Path(__file__).parent.parent))
 
 from ai.memory_buffer import ConfigurableMemoryBuffer
 from core.neural_check import NeuralEngineMonitor
 
+# Characters kept in a log's content_preview, and the most bytes they can take in UTF-8
+_PREVIEW_CHARS = 500
+_PREVIEW_BYTES = 4 * _PREVIEW_CHARS
+
+# Every keyword the health and model checks look for; the lookahead reports
+# overlapping matches, so one scan finds exactly what separate `in` tests would
+_LOG_KEYWORDS_RE = re.compile(r'(?=(cpu|%|memory|gb|mb|neural|ane|model|qwen|phi|gemma))')
+
+# (keyword, model name, model type) for each model detected in the logs
+_AI_MODELS = (
+    ('qwen', 'Qwen3', 'language_model'),
+    ('phi', 'Phi-4', 'reasoning_model'),
+    ('gemma', 'Gemma', 'language_model'),
+)
+
+@lru_cache(maxsize=16)
+def _log_keywords(content: str) -> FrozenSet[str]:
+    """Return the keywords found in a log preview, lowercasing and scanning it once"""
+    return frozenset(_LOG_KEYWORDS_RE.findall(content.lower()))
+
 class SystemIntegration:
     """Integrates System_Setup PERSONA profiling with GIOVANNINI_VAULT AI Memory"""
     
-    def __init__(self):
+    def __init__(self, memory_batch_size: int = 1, memory_flush_interval: float = 300.0):
+        """Create the integration
+        
+        Analyses are written to memory in batches of memory_batch_size, or
+        sooner once the oldest queued one is memory_flush_interval seconds
+        old; call flush_memory() or close() to write the rest. The default
+        batch size of 1 writes each analysis straight away.
+        """
         self.memory = ConfigurableMemoryBuffer()
+        self.memory_batch_size = memory_batch_size
+        self.memory_flush_interval = memory_flush_interval
+        self._memory_batch: List[Dict[str, Any]] = []
+        self._memory_batch_started = 0.0
+        # Seconds a status snapshot is reused by get_integration_status
+        self.status_ttl = 1.0
+        self._status_cache: Optional[Dict[str, Any]] = None
+        self._status_cache_time = 0.0
         self.neural_monitor = NeuralEngineMonitor()
         self.system_setup_path = Path("/Users/giovannini/Library/Mobile Documents/com~apple~CloudDocs/Obsidian/Projects/System_Setup")
         self.logs_path = self.system_setup_path / "Logs"
+        # Parsed log summaries by path, reused while a log's mtime and size are unchanged
+        self._parse_cache: Dict[str, tuple] = {}
     
     def analyze_persona_logs(self) -> Dict[str, Any]:
         """Analyze PERSONA profiling logs and extract insights"""
@@ -40,24 +85,38 @@ class SystemIntegration:
                 'recommendations': []
             }
             
-            # Find latest log files
-            log_files = list(self.logs_path.glob("*.md"))
+            # Find log files; DirEntry.stat is cached and reused when parsing.
+            # Like glob("*.md") hidden logs count, but directories are skipped
+            with os.scandir(self.logs_path) as entries:
+                log_files = [
+                    (entry.stat(), Path(entry.path)) for entry in entries
+                    if entry.name.endswith('.md') and entry.is_file()
+                ]
             analysis['logs_found'] = len(log_files)
             
             if log_files:
-                # Get the most recent log files
-                latest_logs = sorted(log_files, key=lambda x: x.stat().st_mtime, reverse=True)[:5]
+                # Get the most recent log files without sorting them all
+                latest_logs = heapq.nlargest(5, log_files, key=lambda x: x[0].st_mtime)
                 
-                for log_file in latest_logs:
-                    log_data = self._parse_log_file(log_file)
-                    if log_data:
-                        analysis['latest_logs'].append(log_data)
+                # Read them concurrently; on iCloud-backed paths each read is mostly I/O wait.
+                # Each log is scanned once, as it arrives, for both health and models
+                health = self._new_health()
+                models = {}
+                with ThreadPoolExecutor(max_workers=len(latest_logs)) as executor:
+                    for log_data in executor.map(self._parse_log_file,
+                                                 [path for _, path in latest_logs],
+                                                 [stat for stat, _ in latest_logs]):
+                        if log_data:
+                            analysis['latest_logs'].append(log_data)
+                            found = _log_keywords(log_data['content_preview'])
+                            self._update_health(health, found)
+                            self._update_models(models, found, log_data['file_name'])
                 
                 # Analyze system health
-                analysis['system_health'] = self._analyze_system_health(analysis['latest_logs'])
+                analysis['system_health'] = self._finish_health(health)
                 
                 # Extract AI models information
-                analysis['ai_models'] = self._extract_ai_models(analysis['latest_logs'])
+                analysis['ai_models'] = list(models.values())
                 
                 # Generate recommendations
                 analysis['recommendations'] = self._generate_recommendations(analysis)
@@ -66,26 +125,64 @@ class SystemIntegration:
         except Exception as e:
             return {'error': str(e)}
     
-    def _parse_log_file(self, log_file: Path) -> Optional[Dict[str, Any]]:
-        """Parse a single log file"""
+    def _parse_log_file(self, log_file: Path,
+                        stat: Optional[os.stat_result] = None) -> Optional[Dict[str, Any]]:
+        """Parse a single log file
+        
+        Only the head needed for the preview is read; content_length is the
+        file size in bytes. Unchanged logs are served from the parse cache.
+        Pass stat to reuse a result the caller already has.
+        """
         try:
-            with open(log_file, 'r', encoding='utf-8') as f:
-                content = f.read()
+            key = str(log_file)
+            if stat is None:
+                stat = log_file.stat()
+            cached = self._parse_cache.get(key)
+            if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+                return dict(cached[2])
             
-            return {
+            with open(log_file, 'rb') as f:
+                head = f.read(_PREVIEW_BYTES)
+            
+            # The incremental decoder holds back a character cut off by the read limit
+            content = codecs.getincrementaldecoder('utf-8')('replace').decode(head)
+            truncated = len(content) > _PREVIEW_CHARS or stat.st_size > len(head)
+            
+            log_data = {
                 'file_name': log_file.name,
-                'file_path': str(log_file),
-                'file_size': log_file.stat().st_size,
-                'modified': datetime.fromtimestamp(log_file.stat().st_mtime).isoformat(),
-                'content_preview': content[:500] + "..." if len(content) > 500 else content,
-                'content_length': len(content)
+                'file_path': key,
+                'file_size': stat.st_size,
+                'modified': datetime.fromtimestamp(stat.st_mtime).isoformat(),
+                'content_preview': content[:_PREVIEW_CHARS] + "..." if truncated else content,
+                'content_length': stat.st_size
             }
+            self._parse_cache[key] = (stat.st_mtime_ns, stat.st_size, log_data)
+            return dict(log_data)
         except Exception as e:
             return None
     
     def _analyze_system_health(self, logs: List[Dict]) -> Dict[str, Any]:
         """Analyze system health from logs"""
-        health = {
+        health = self._new_health()
+        for log in logs:
+            self._update_health(health, _log_keywords(log.get('content_preview', '')))
+        return self._finish_health(health)
+    
+    def _extract_ai_models(self, logs: List[Dict]) -> List[Dict[str, Any]]:
+        """Extract AI models information from logs
+        
+        Each model is reported once, from the first log that mentions it.
+        """
+        models = {}
+        for log in logs:
+            self._update_models(models, _log_keywords(log.get('content_preview', '')),
+                                log['file_name'])
+        return list(models.values())
+    
+    @staticmethod
+    def _new_health() -> Dict[str, Any]:
+        """Initial system health, before any log has been seen"""
+        return {
             'status': 'unknown',
             'cpu_usage': 'unknown',
             'memory_usage': 'unknown',
@@ -93,21 +190,23 @@ class SystemIntegration:
             'ai_models_loaded': 0,
             'issues_found': []
         }
-        
-        for log in logs:
-            content = log.get('content_preview', '').lower()
-            
-            # Check for system health indicators
-            if 'cpu' in content and '%' in content:
-                health['cpu_usage'] = 'detected'
-            if 'memory' in content and ('gb' in content or 'mb' in content):
-                health['memory_usage'] = 'detected'
-            if 'neural' in content or 'ane' in content:
-                health['neural_engine'] = 'detected'
-            if 'model' in content and ('qwen' in content or 'phi' in content):
-                health['ai_models_loaded'] += 1
-        
-        # Determine overall status
+    
+    @staticmethod
+    def _update_health(health: Dict[str, Any], found: FrozenSet[str]):
+        """Fold one log's keywords into the system health indicators"""
+        # Check for system health indicators
+        if 'cpu' in found and '%' in found:
+            health['cpu_usage'] = 'detected'
+        if 'memory' in found and ('gb' in found or 'mb' in found):
+            health['memory_usage'] = 'detected'
+        if 'neural' in found or 'ane' in found:
+            health['neural_engine'] = 'detected'
+        if 'model' in found and ('qwen' in found or 'phi' in found):
+            health['ai_models_loaded'] += 1
+    
+    @staticmethod
+    def _finish_health(health: Dict[str, Any]) -> Dict[str, Any]:
+        """Set the overall status once every log has been folded in"""
         indicators = [health['cpu_usage'], health['memory_usage'], health['neural_engine']]
         if all(ind == 'detected' for ind in indicators):
             health['status'] = 'healthy'
@@ -118,60 +217,34 @@ class SystemIntegration:
         
         return health
     
-    def _extract_ai_models(self, logs: List[Dict]) -> List[Dict[str, Any]]:
-        """Extract AI models information from logs"""
-        models = []
-        
-        for log in logs:
-            content = log.get('content_preview', '')
-            
-            # Look for model references
-            if 'qwen' in content.lower():
-                models.append({
-                    'name': 'Qwen3',
-                    'type': 'language_model',
-                    'detected_in': log['file_name'],
-                    'status': 'available'
-                })
-            if 'phi' in content.lower():
-                models.append({
-                    'name': 'Phi-4',
-                    'type': 'reasoning_model',
-                    'detected_in': log['file_name'],
-                    'status': 'available'
-                })
-            if 'gemma' in content.lower():
-                models.append({
-                    'name': 'Gemma',
-                    'type': 'language_model',
-                    'detected_in': log['file_name'],
+    @staticmethod
+    def _update_models(models: Dict[str, Dict[str, Any]], found: FrozenSet[str], file_name: str):
+        """Record models referenced by one log that no earlier log mentioned"""
+        for keyword, name, model_type in _AI_MODELS:
+            if keyword in found and name not in models:
+                models[name] = {
+                    'name': name,
+                    'type': model_type,
+                    'detected_in': file_name,
                     'status': 'available'
-                })
-        
-        # Remove duplicates
-        unique_models = []
-        seen_names = set()
-        for model in models:
-            if model['name'] not in seen_names:
-                unique_models.append(model)
-                seen_names.add(model['name'])
-        
-        return unique_models
+                }
     
     def _generate_recommendations(self, analysis: Dict) -> List[str]:
         """Generate recommendations based on analysis"""
         recommendations = []
+        health = analysis['system_health']
+        model_count = len(analysis['ai_models'])
         
         # System health recommendations
-        if analysis['system_health']['status'] == 'unknown':
+        if health['status'] == 'unknown':
             recommendations.append("Execute PERSONA profiling to get current system status")
         
-        if analysis['system_health']['ai_models_loaded'] == 0:
+        if health['ai_models_loaded'] == 0:
             recommendations.append("Load AI models in LM Studio for optimal performance")
         
         # AI models recommendations
-        if len(analysis['ai_models']) > 0:
-            recommendations.append(f"Found {len(analysis['ai_models'])} AI models - consider optimizing usage")
+        if model_count > 0:
+            recommendations.append(f"Found {model_count} AI models - consider optimizing usage")
         
         # Log management recommendations
         if analysis['logs_found'] > 10:
@@ -200,38 +273,81 @@ class SystemIntegration:
                 }
             }
             
-            return self.memory.add_memory_entry(**memory_entry)
+            if not self._memory_batch:
+                self._memory_batch_started = time.monotonic()
+            self._memory_batch.append(memory_entry)
+            if (len(self._memory_batch) >= self.memory_batch_size or
+                    time.monotonic() - self._memory_batch_started >= self.memory_flush_interval):
+                return self.flush_memory()
+            return True
         except Exception as e:
             print(f"Error storing analysis in memory: {e}")
             return False
     
-    def get_integration_status(self) -> Dict[str, Any]:
-        """Get current integration status"""
+    def flush_memory(self) -> bool:
+        """Write queued analyses to the AI memory system in one batch"""
+        if not self._memory_batch:
+            return True
+        batch, self._memory_batch = self._memory_batch, []
+        # The cached status counts memory entries, which this changes
+        self._status_cache = None
+        try:
+            stored = self.memory.add_memory_entries(batch)
+        except Exception as e:
+            print(f"Error storing analysis in memory: {e}")
+            stored = False
+        if not stored:
+            # Keep the batch queued, ahead of newer analyses, for the next flush
+            self._memory_batch[:0] = batch
+        return stored
+    
+    def close(self):
+        """Write any queued analyses; call before exiting when batching"""
+        self.flush_memory()
+    
+    def get_integration_status(self,
+                               neural_metrics: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Get current integration status
+        
+        Pass neural_metrics to reuse system metrics sampled by the caller.
+        Otherwise a snapshot taken less than status_ttl seconds ago is
+        returned, sparing repeated refreshes the metrics and memory queries.
+        """
+        if (neural_metrics is None and self._status_cache is not None and
+                time.monotonic() - self._status_cache_time < self.status_ttl):
+            return dict(self._status_cache)
+        
         try:
             # Check if System_Setup exists
             system_setup_exists = self.system_setup_path.exists()
             logs_exist = self.logs_path.exists() if system_setup_exists else False
             
-            # Check memory system
-            memory_stats = self.memory.get_memory_stats()
+            # Check memory system; the flags only need to know whether any entry exists
+            memory_active = self.memory.has_entries()
             
             # Get neural engine status
-            neural_metrics = self.neural_monitor.get_system_metrics()
+            if neural_metrics is None:
+                neural_metrics = self.neural_monitor.get_system_metrics()
             
-            return {
+            status = {
                 'timestamp': datetime.now().isoformat(),
                 'system_setup_available': system_setup_exists,
                 'persona_logs_available': logs_exist,
-                'memory_system_status': 'active' if memory_stats['total_entries'] > 0 else 'inactive',
+                'memory_system_status': 'active' if memory_active else 'inactive',
                 'neural_engine_status': 'active' if 'error' not in neural_metrics else 'inactive',
                 'integration_health': 'healthy' if all([
                     system_setup_exists, 
                     logs_exist, 
-                    memory_stats['total_entries'] > 0
+                    memory_active
                 ]) else 'needs_attention',
-                'memory_entries': memory_stats['total_entries'],
+                # The full statistics are only computed for the reported count
+                'memory_entries': (self.memory.get_memory_stats()['total_entries']
+                                   if memory_active else 0),
                 'system_metrics': neural_metrics
             }
+            self._status_cache = status
+            self._status_cache_time = time.monotonic()
+            return dict(status)
         except Exception as e:
             return {'error': str(e)}
     
@@ -247,13 +363,17 @@ class SystemIntegration:
             if 'error' in analysis:
                 return {'error': f"Analysis failed: {analysis['error']}"}
             
-            # Step 2: Store analysis in memory
+            # Step 2: Store analysis in memory, sampling system metrics meanwhile;
+            # the status below counts memory entries, so it waits for the store
             print("💾 Storing analysis in AI memory...")
-            memory_stored = self.store_analysis_in_memory(analysis)
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                metrics_future = executor.submit(self.neural_monitor.get_system_metrics)
+                memory_stored = self.store_analysis_in_memory(analysis)
+                neural_metrics = metrics_future.result()
             
             # Step 3: Get integration status
             print("📈 Checking integration status...")
-            status = self.get_integration_status()
+            status = self.get_integration_status(neural_metrics)
             
             return {
                 'success': True,
@@ -289,7 +409,11 @@ def main():
     
     # Run full integration
     print(f"\n🚀 Running full integration...")
-    result = integration.run_full_integration()
+    try:
+        result = integration.run_full_integration()
+    finally:
+        # Write analyses still queued by a batch size above one
+        integration.close()
     
     if 'error' in result:
         print(f"❌ Integration failed: {result['error']}")
@@ -10,19 +10,37 @@ __author__ = "Eduardo Giovannini"
 __email__ = "eduardo@giovannini.us"
 __description__ = "Professional AI & Automation Toolkit for Apple Silicon"
 
+import importlib
+
 # Core modules
 from .launcher import NeuralVaultLauncher
 
-# AI modules
-from ..ai.memory_buffer import ConfigurableMemoryBuffer
+# Heavier tools load on first attribute access (PEP 562), so importing the
+# package for one of them does not pull in the database, psutil or Core ML stacks
+_LAZY_IMPORTS = {
+    # AI modules
+    "ConfigurableMemoryBuffer": "ai.memory_buffer",
+    # Core modules
+    "NeuralEngineMonitor": "core.neural_check",
+    "CoreMLConverter": "core.coreml",
+    "FileOrganizer": "core.folder_organizer",
+    # Integration modules
+    "SystemIntegration": "integration.system_integration",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    # Cache on the package so later lookups skip __getattr__
+    globals()[name] = value
+    return value
 
-# Core modules
-from ..core.neural_check import NeuralEngineMonitor
-from ..core.coreml import CoreMLConverter
-from ..core.folder_organizer import FileOrganizer
 
-# Integration modules
-from ..integration.system_integration import SystemIntegration
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
 
 __all__ = [
     "NeuralVaultLauncher",
@@ -5,10 +5,27 @@ Quick launcher for all your AI tools and monitoring systems
 """
 import os
 import sys
+import importlib
 import subprocess
 from pathlib import Path
 import argparse
 
+# Tool packages (ai, core, ...) live next to this package under src/; only a
+# script run needs src/ added, since importing neuralforge means it is on sys.path
+if not __package__:
+    sys.path.append(str(Path(__file__).parent.parent))
+
+# ANSI erase-display and cursor-home sequence
+_CLEAR_SCREEN = "\033[2J\033[H"
+
+def _dir_names(directory: Path) -> set:
+    """Names in a directory from one scandir, or an empty set if it cannot be listed"""
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name for entry in entries}
+    except OSError:
+        return set()
+
 class NeuralVaultLauncher:
     def __init__(self):
         self.project_root = Path(__file__).parent
@@ -40,89 +57,81 @@ class NeuralVaultLauncher:
         print("9. 📊 Project Status")
         print("0. 🚪 Exit")
         
+    def _run_tool(self, module_name: str, failure_message: str, missing_message: str):
+        """Run a tool's main() in this interpreter instead of a new Python process
+        
+        Modules stay imported between menu choices, so running a tool again
+        skips interpreter start-up and re-imports. A module without main()
+        is run as a script in a subprocess.
+        """
+        try:
+            module = importlib.import_module(module_name)
+        except ImportError as e:
+            print(f"❌ {missing_message}: {e}")
+            return
+        
+        entry_point = getattr(module, "main", None)
+        if entry_point is None:
+            try:
+                subprocess.run([sys.executable, module.__file__], check=True)
+            except subprocess.CalledProcessError:
+                print(f"❌ {failure_message}")
+            return
+        
+        # Tools read sys.argv as if they were run as scripts
+        saved_argv = sys.argv
+        sys.argv = [module.__file__]
+        try:
+            entry_point()
+        except SystemExit as e:
+            if e.code not in (None, 0):
+                print(f"❌ {failure_message}")
+        except Exception as e:
+            print(f"❌ {failure_message}: {e}")
+        finally:
+            sys.argv = saved_argv
+    
     def launch_neural_monitor(self):
         """Launch the Neural Engine monitoring tool"""
         print("\n🧠 Launching Neural Engine Monitor...")
-        script_path = self.core_dir / "neural_check.py"
-        if script_path.exists():
-            try:
-                subprocess.run([sys.executable, str(script_path)], check=True)
-            except subprocess.CalledProcessError:
-                print("❌ Neural monitor failed to start")
-        else:
-            print("❌ Neural monitor script not found")
+        self._run_tool("core.neural_check", "Neural monitor failed to start",
+                       "Neural monitor script not found")
             
     def launch_file_organizer(self):
         """Launch the file organization tool"""
         print("\n📁 Launching File Organizer...")
-        script_path = self.core_dir / "folder_organizer.py"
-        if script_path.exists():
-            try:
-                subprocess.run([sys.executable, str(script_path)], check=True)
-            except subprocess.CalledProcessError:
-                print("❌ File organizer failed to start")
-        else:
-            print("❌ File organizer script not found")
+        self._run_tool("core.folder_organizer", "File organizer failed to start",
+                       "File organizer script not found")
             
     def launch_coreml_tool(self):
         """Launch the Core ML integration tool"""
         print("\n🔧 Launching Core ML Integration...")
-        script_path = self.core_dir / "coreml.py"
-        if script_path.exists():
-            try:
-                subprocess.run([sys.executable, str(script_path)], check=True)
-            except subprocess.CalledProcessError:
-                print("❌ Core ML tool failed to start")
-        else:
-            print("❌ Core ML script not found")
+        self._run_tool("core.coreml", "Core ML tool failed to start",
+                       "Core ML script not found")
             
     def launch_memory_system(self):
         """Launch the AI memory system"""
         print("\n💾 Launching AI Memory System...")
-        script_path = self.ai_dir / "memory_buffer.py"
-        if script_path.exists():
-            try:
-                subprocess.run([sys.executable, str(script_path)], check=True)
-            except subprocess.CalledProcessError:
-                print("❌ Memory system failed to start")
-        else:
-            print("❌ Memory system script not found")
+        self._run_tool("ai.memory_buffer", "Memory system failed to start",
+                       "Memory system script not found")
             
     def launch_web_scraper(self):
         """Launch the web scraping tool"""
         print("\n🌐 Launching Web Scraper...")
-        script_path = self.web_dir / "gui_scraper.py"
-        if script_path.exists():
-            try:
-                subprocess.run([sys.executable, str(script_path)], check=True)
-            except subprocess.CalledProcessError:
-                print("❌ Web scraper failed to start")
-        else:
-            print("❌ Web scraper script not found")
+        self._run_tool("web.gui_scraper", "Web scraper failed to start",
+                       "Web scraper script not found")
             
     def launch_email_automation(self):
         """Launch the email automation tool"""
         print("\n📧 Launching Email Automation...")
-        script_path = self.automation_dir / "email_automation.py"
-        if script_path.exists():
-            try:
-                subprocess.run([sys.executable, str(script_path)], check=True)
-            except subprocess.CalledProcessError:
-                print("❌ Email automation failed to start")
-        else:
-            print("❌ Email automation script not found")
+        self._run_tool("automation.email_automation", "Email automation failed to start",
+                       "Email automation script not found")
             
     def launch_schedule_automation(self):
         """Launch the schedule automation tool"""
         print("\n⏰ Launching Schedule Automation...")
-        script_path = self.automation_dir / "schedule_automation.py"
-        if script_path.exists():
-            try:
-                subprocess.run([sys.executable, str(script_path)], check=True)
-            except subprocess.CalledProcessError:
-                print("❌ Schedule automation failed to start")
-        else:
-            print("❌ Schedule automation script not found")
+        self._run_tool("automation.schedule_automation", "Schedule automation failed to start",
+                       "Schedule automation script not found")
             
     def run_tests(self):
         """Run the test suite"""
@@ -139,44 +148,43 @@ class NeuralVaultLauncher:
         print("\n📊 NEURAL_CORE_VAULT Project Status:")
         print("="*50)
         
+        # One directory listing per folder instead of a stat per file
         # Check core tools
         print("🔧 Core Tools:")
+        core_names = _dir_names(self.core_dir)
         for tool in ["neural_check.py", "folder_organizer.py", "coreml.py"]:
-            path = self.core_dir / tool
-            status = "✅" if path.exists() else "❌"
+            status = "✅" if tool in core_names else "❌"
             print(f"   {status} {tool}")
             
         # Check AI tools
         print("\n🧠 AI Tools:")
+        ai_names = _dir_names(self.ai_dir)
         for tool in ["memory_buffer.py", "document_tagger.py"]:
-            path = self.ai_dir / tool
-            status = "✅" if path.exists() else "❌"
+            status = "✅" if tool in ai_names else "❌"
             print(f"   {status} {tool}")
             
         # Check web tools
         print("\n🌐 Web Tools:")
+        web_names = _dir_names(self.web_dir)
         for tool in ["gui_scraper.py"]:
-            path = self.web_dir / tool
-            status = "✅" if path.exists() else "❌"
+            status = "✅" if tool in web_names else "❌"
             print(f"   {status} {tool}")
             
         # Check automation tools
         print("\n🤖 Automation Tools:")
+        automation_names = _dir_names(self.automation_dir)
         for tool in ["email_automation.py", "schedule_automation.py"]:
-            path = self.automation_dir / tool
-            status = "✅" if path.exists() else "❌"
+            status = "✅" if tool in automation_names else "❌"
             print(f"   {status} {tool}")
             
         # Check configuration
         print("\n⚙️  Configuration:")
-        config_path = self.project_root / "config" / "memory_config.json"
-        status = "✅" if config_path.exists() else "❌"
+        status = "✅" if "memory_config.json" in _dir_names(self.project_root / "config") else "❌"
         print(f"   {status} PostgreSQL Configuration")
         
         # Check dependencies
         print("\n📦 Dependencies:")
-        req_path = self.project_root / "requirements.txt"
-        status = "✅" if req_path.exists() else "❌"
+        status = "✅" if "requirements.txt" in _dir_names(self.project_root) else "❌"
         print(f"   {status} Requirements File")
         
         print("\n🎯 Project is ready for AI development!")
@@ -220,10 +228,15 @@ class NeuralVaultLauncher:
                 print(f"❌ Error: {e}")
                 
             input("\n⏸️  Press Enter to continue...")
-            os.system('clear' if os.name == 'posix' else 'cls')
+            # Clear the screen and home the cursor without spawning a shell
+            sys.stdout.write(_CLEAR_SCREEN)
+            sys.stdout.flush()
 
 def main():
     """Main entry point"""
+    if os.name == 'nt':
+        # An empty command makes the Windows console process ANSI escape sequences
+        os.system('')
     launcher = NeuralVaultLauncher()
     launcher.show_banner()
     launcher.main_loop()
@@ -3,13 +3,68 @@ Natural Language Interface for NeuralForge
 Process natural language commands and execute actions
 """
 import re
+import io
 import json
-from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass
+import asyncio
+import importlib
+import importlib.util
+from contextlib import redirect_stderr, redirect_stdout
+from typing import Callable, Dict, List, Optional, Tuple
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from datetime import datetime
 from pathlib import Path
 import subprocess
 import sys
 
+# Tool packages (core, ai, ...) live next to this package under src/; only a
+# script run needs src/ added
+if not __package__:
+    sys.path.append(str(Path(__file__).parent.parent))
+
+try:
+    import re2
+except ImportError:
+    re2 = None
+
+def _compile(pattern: str, flags: int = 0) -> re.Pattern:
+    """Compile a pattern, using RE2 when it is installed"""
+    if re2 is None:
+        return re.compile(pattern, flags)
+    # RE2 matches in linear time but has no lookaround or backreferences;
+    # none of the patterns here use them
+    if flags & re.IGNORECASE:
+        pattern = f"(?i){pattern}"
+    return re2.compile(pattern)
+
+_URL_RE = _compile(r'https?://[^\s]+')
+_EMAIL_RE = _compile(r'[\w\.-]+@[\w\.-]+\.\w+')
+_TIME_RE = _compile(r'(?:at|in|for)\s+(\d+)\s*(?:am|pm|hours?|minutes?|days?)')
+_TASK_RE = _compile(r'(?:to|for)\s+(.+)')
+
+# Single-word inputs that resolve to an action without the regex pass
+_KEYWORD_ACTIONS = {
+    "help": "help",
+    "command": "help",
+    "commands": "help",
+    "option": "help",
+    "options": "help",
+}
+
+_CONFIDENCE_KEYWORDS = ('organize', 'monitor', 'scrape', 'email', 'schedule', 'analytics')
+
+# Tools that can run unbounded: they walk and hash whole directories, wait on
+# a database or the network, prompt for input or run until interrupted. They
+# keep a subprocess so the timeout can stop them; other actions added to
+# tool_mappings run in-process
+_SUBPROCESS_ACTIONS = frozenset({
+    "organize_files", "monitor_system", "ai_memory", "web_scraping",
+    "email_automation", "schedule_task", "analytics",
+})
+
+# Distinct inputs remembered by parse_command
+_PARSE_CACHE_SIZE = 256
+
 @dataclass
 class Command:
     """Represents a parsed command"""
@@ -23,12 +78,14 @@ class NaturalLanguageProcessor:
     
     def __init__(self):
         self.command_patterns = self._load_command_patterns()
+        self._pattern_index, self._combined_pattern = self._combine_patterns(self.command_patterns)
         self.tool_mappings = self._load_tool_mappings()
         self.context = {}
+        self._parse_cache: "OrderedDict[str, Optional[Command]]" = OrderedDict()
     
-    def _load_command_patterns(self) -> Dict[str, List[str]]:
-        """Load command patterns for different actions"""
-        return {
+    def _load_command_patterns(self) -> Dict[str, List[re.Pattern]]:
+        """Load compiled command patterns for different actions"""
+        patterns = {
             "organize_files": [
                 r"organize\s+(?:my\s+)?(?:files|downloads|desktop|documents)",
                 r"clean\s+up\s+(?:my\s+)?(?:files|downloads|desktop|documents)",
@@ -82,17 +139,33 @@ class NaturalLanguageProcessor:
                 r"options?",
             ]
         }
+        return {
+            action: [_compile(pattern, re.IGNORECASE) for pattern in action_patterns]
+            for action, action_patterns in patterns.items()
+        }
+    
+    def _combine_patterns(self, command_patterns: Dict[str, List[re.Pattern]]) -> Tuple[List[Tuple[str, re.Pattern]], re.Pattern]:
+        """Combine all command patterns into one alternation"""
+        # Each branch may skip ahead on its own, so the first pattern in table
+        # order that matches anywhere wins, as with a loop over the patterns
+        pattern_index = []
+        branches = []
+        for action, patterns in command_patterns.items():
+            for pattern in patterns:
+                branches.append(f"(?P<p{len(pattern_index)}>[\\s\\S]*?(?:{pattern.pattern}))")
+                pattern_index.append((action, pattern))
+        return pattern_index, _compile("|".join(branches), re.IGNORECASE)
     
     def _load_tool_mappings(self) -> Dict[str, str]:
-        """Load mappings from actions to tool scripts"""
+        """Load mappings from actions to tool modules"""
         return {
-            "organize_files": "src/core/folder_organizer.py",
-            "monitor_system": "src/core/neural_check.py",
-            "ai_memory": "src/ai/memory_buffer.py",
-            "web_scraping": "src/web/gui_scraper.py",
-            "email_automation": "src/automation/email_automation.py",
-            "schedule_task": "src/automation/schedule_automation.py",
-            "analytics": "src/visual/terminal_dashboard.py",
+            "organize_files": "core.folder_organizer",
+            "monitor_system": "core.neural_check",
+            "ai_memory": "ai.memory_buffer",
+            "web_scraping": "web.gui_scraper",
+            "email_automation": "automation.email_automation",
+            "schedule_task": "automation.schedule_automation",
+            "analytics": "visual.terminal_dashboard",
             "help": "help"
         }
     
@@ -100,36 +173,52 @@ class NaturalLanguageProcessor:
         """Parse natural language input into a command"""
         user_input = user_input.lower().strip()
         
-        best_match = None
-        best_confidence = 0.0
+        # Repeated phrases are answered from a small LRU cache
+        if user_input in self._parse_cache:
+            self._parse_cache.move_to_end(user_input)
+            command = self._parse_cache[user_input]
+        else:
+            command = self._parse_normalized(user_input)
+            self._parse_cache[user_input] = command
+            if len(self._parse_cache) > _PARSE_CACHE_SIZE:
+                self._parse_cache.popitem(last=False)
         
-        for action, patterns in self.command_patterns.items():
-            for pattern in patterns:
-                match = re.search(pattern, user_input, re.IGNORECASE)
-                if match:
-                    confidence = self._calculate_confidence(user_input, pattern, match)
-                    if confidence > best_confidence:
-                        best_match = {
-                            'action': action,
-                            'target': match.group(1) if match.groups() else "",
-                            'parameters': self._extract_parameters(user_input, action),
-                            'confidence': confidence
-                        }
-                        best_confidence = confidence
+        # Callers get their own parameters dict, so the cached command stays intact
+        return replace(command, parameters=dict(command.parameters)) if command else None
+    
+    def _parse_normalized(self, user_input: str) -> Optional[Command]:
+        """Parse lowercased, stripped input without the cache"""
+        action = _KEYWORD_ACTIONS.get(user_input)
+        if action:
+            return Command(action, "", {}, self._calculate_confidence(user_input, None, None))
         
-        if best_match and best_confidence > 0.3:  # Minimum confidence threshold
-            return Command(**best_match)
+        # One pass finds which pattern matched; only that pattern is re-run
+        # to get its captured target
+        combined = self._combined_pattern.match(user_input)
+        if not combined:
+            return None
+        
+        action, pattern = self._pattern_index[int(combined.lastgroup[1:])]
+        match = pattern.search(user_input)
+        confidence = self._calculate_confidence(user_input, pattern, match)
+        
+        if confidence > 0.3:  # Minimum confidence threshold
+            return Command(
+                action=action,
+                target=match.group(1) if match.groups() else "",
+                parameters=self._extract_parameters(user_input, action),
+                confidence=confidence
+            )
         
         return None
     
-    def _calculate_confidence(self, user_input: str, pattern: str, match) -> float:
+    def _calculate_confidence(self, user_input: str, pattern: Optional[re.Pattern], match) -> float:
         """Calculate confidence score for a match"""
         # Base confidence from regex match
         base_confidence = 0.7
         
         # Boost confidence for exact keyword matches
-        keywords = ['organize', 'monitor', 'scrape', 'email', 'schedule', 'analytics']
-        keyword_boost = sum(0.1 for keyword in keywords if keyword in user_input)
+        keyword_boost = sum(0.1 for keyword in _CONFIDENCE_KEYWORDS if keyword in user_input)
         
         # Boost confidence for complete sentences
         sentence_boost = 0.1 if len(user_input.split()) > 3 else 0
@@ -153,7 +242,8 @@ class NaturalLanguageProcessor:
         
         # Extract URL for web scraping
         elif action == "web_scraping":
-            url_match = re.search(r'https?://[^\s]+', user_input)
+            # A URL needs "://" and an address needs "@", so most inputs skip the regex
+            url_match = _URL_RE.search(user_input) if "://" in user_input else None
             if url_match:
                 parameters["url"] = url_match.group(0)
             else:
@@ -161,7 +251,7 @@ class NaturalLanguageProcessor:
         
         # Extract email recipient
         elif action == "email_automation":
-            email_match = re.search(r'[\w\.-]+@[\w\.-]+\.\w+', user_input)
+            email_match = _EMAIL_RE.search(user_input) if "@" in user_input else None
             if email_match:
                 parameters["recipient"] = email_match.group(0)
             else:
@@ -170,12 +260,12 @@ class NaturalLanguageProcessor:
         # Extract task description for scheduling
         elif action == "schedule_task":
             # Extract time references
-            time_match = re.search(r'(?:at|in|for)\s+(\d+)\s*(?:am|pm|hours?|minutes?|days?)', user_input)
+            time_match = _TIME_RE.search(user_input)
             if time_match:
                 parameters["time"] = time_match.group(1)
             
             # Extract task description
-            task_match = re.search(r'(?:to|for)\s+(.+)', user_input)
+            task_match = _TASK_RE.search(user_input)
             if task_match:
                 parameters["task"] = task_match.group(1)
         
@@ -187,30 +277,128 @@ class NaturalLanguageProcessor:
             if command.action == "help":
                 return True, self._get_help_message()
             
-            tool_script = self.tool_mappings.get(command.action)
-            if not tool_script:
+            module_name = self.tool_mappings.get(command.action)
+            if not module_name:
                 return False, f"Unknown action: {command.action}"
             
-            # Build command arguments
-            args = [sys.executable, tool_script]
-            
-            # Add parameters
-            for key, value in command.parameters.items():
-                args.extend([f"--{key}", value])
+            args = self._tool_args(command)
             
             # Execute the tool
-            result = subprocess.run(args, capture_output=True, text=True, timeout=30)
+            if command.action in _SUBPROCESS_ACTIONS:
+                success, output = self._run_tool_subprocess(module_name, args)
+            else:
+                success, output = self._run_tool(module_name, args)
             
-            if result.returncode == 0:
-                return True, f"✅ {command.action.replace('_', ' ').title()} completed successfully!\n{result.stdout}"
+            if success:
+                return True, f"✅ {command.action.replace('_', ' ').title()} completed successfully!\n{output}"
             else:
-                return False, f"❌ {command.action.replace('_', ' ').title()} failed:\n{result.stderr}"
+                return False, f"❌ {command.action.replace('_', ' ').title()} failed:\n{output}"
                 
         except subprocess.TimeoutExpired:
             return False, f"❌ {command.action.replace('_', ' ').title()} timed out"
         except Exception as e:
             return False, f"❌ Error executing {command.action}: {str(e)}"
     
+    async def execute_command_async(self, command: Command,
+                                    on_output: Optional[Callable[[str], None]] = None,
+                                    timeout: float = 30) -> Tuple[bool, str]:
+        """Execute a parsed command without blocking the event loop
+        
+        Every tool runs in its own process, passing each line of output to
+        on_output as it arrives. Running main() in-process would swap the
+        process-wide sys.stdout and sys.argv while other commands run.
+        """
+        try:
+            if command.action == "help":
+                return True, self._get_help_message()
+            
+            module_name = self.tool_mappings.get(command.action)
+            if not module_name:
+                return False, f"Unknown action: {command.action}"
+            
+            args = self._tool_args(command)
+            
+            # Execute the tool
+            success, output = await self._stream_tool_subprocess(module_name, args, on_output, timeout)
+            
+            if success:
+                return True, f"✅ {command.action.replace('_', ' ').title()} completed successfully!\n{output}"
+            else:
+                return False, f"❌ {command.action.replace('_', ' ').title()} failed:\n{output}"
+                
+        except asyncio.TimeoutError:
+            return False, f"❌ {command.action.replace('_', ' ').title()} timed out"
+        except Exception as e:
+            return False, f"❌ Error executing {command.action}: {str(e)}"
+    
+    def _tool_args(self, command: Command) -> List[str]:
+        """Build script-style arguments from command parameters"""
+        args = []
+        for key, value in command.parameters.items():
+            args.extend([f"--{key}", value])
+        return args
+    
+    def _run_tool(self, module_name: str, args: List[str]) -> Tuple[bool, str]:
+        """Run a tool's main() in this interpreter and capture what it prints
+        
+        Modules stay imported between commands, so later runs skip interpreter
+        start-up and re-imports.
+        """
+        module = importlib.import_module(module_name)
+        stdout, stderr = io.StringIO(), io.StringIO()
+        
+        # Tools read sys.argv as if they were run as scripts
+        saved_argv = sys.argv
+        sys.argv = [module.__file__, *args]
+        try:
+            with redirect_stdout(stdout), redirect_stderr(stderr):
+                module.main()
+        except SystemExit as e:
+            if e.code not in (None, 0):
+                return False, stderr.getvalue() or str(e.code)
+        finally:
+            sys.argv = saved_argv
+        return True, stdout.getvalue()
+    
+    def _run_tool_subprocess(self, module_name: str, args: List[str]) -> Tuple[bool, str]:
+        """Run a tool as a script in a new Python process with a timeout"""
+        tool_script = importlib.util.find_spec(module_name).origin
+        result = subprocess.run([sys.executable, tool_script, *args],
+                                capture_output=True, text=True, timeout=30)
+        if result.returncode == 0:
+            return True, result.stdout
+        return False, result.stderr
+    
+    async def _stream_tool_subprocess(self, module_name: str, args: List[str],
+                                      on_output: Optional[Callable[[str], None]],
+                                      timeout: float) -> Tuple[bool, str]:
+        """Run a tool as a script in a new Python process, streaming its output"""
+        tool_script = importlib.util.find_spec(module_name).origin
+        process = await asyncio.create_subprocess_exec(
+            sys.executable, tool_script, *args,
+            stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+        )
+        lines = []
+        
+        async def read_stdout():
+            async for line in process.stdout:
+                text = line.decode('utf-8', errors='replace')
+                lines.append(text)
+                if on_output:
+                    on_output(text.rstrip('\n'))
+        
+        try:
+            _, stderr, returncode = await asyncio.wait_for(
+                asyncio.gather(read_stdout(), process.stderr.read(), process.wait()), timeout
+            )
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
+            raise
+        if returncode == 0:
+            return True, "".join(lines)
+        return False, stderr.decode('utf-8', errors='replace')
+    
     def _get_help_message(self) -> str:
         """Get help message with available commands"""
         return """
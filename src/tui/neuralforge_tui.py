@@ -15,13 +15,18 @@ from textual.app import App, ComposeResult
 from textual.containers import Container, Horizontal, Vertical
 from textual.widgets import (
     Header, Footer, Static, Button, DataTable, ProgressBar, 
-    TextArea, Label, Switch, Input, Select, Tabs, Tab
+    Label, Switch, Input, Select, Tabs, Tab, RichLog
 )
 from textual.reactive import reactive
 from textual.binding import Binding
 from rich.text import Text
 from rich.console import Console
 
+# Constant for the life of the process
+_PLATFORM = f"{platform.system()} {platform.release()}"
+_MACHINE = platform.machine()
+_PYTHON_VERSION = platform.python_version()
+
 class MetricsWidget(Static):
     """Widget for displaying system metrics"""
     
@@ -33,6 +38,8 @@ class MetricsWidget(Static):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.console = Console()
+        # Prime the CPU counter so later non-blocking reads cover the time since the previous call
+        psutil.cpu_percent(interval=None)
     
     def compose(self) -> ComposeResult:
         yield Label("📊 System Metrics", classes="header")
@@ -51,11 +58,22 @@ class MetricsWidget(Static):
     
     def update_metrics(self) -> None:
         """Update system metrics"""
-        self.cpu_usage = psutil.cpu_percent(interval=1)
+        # Sampled on a worker thread so the UI never waits on psutil
+        self.run_worker(self._sample_metrics, thread=True, exclusive=True, group="metrics")
+    
+    def _sample_metrics(self) -> None:
+        """Take one psutil snapshot and hand it to the UI thread"""
+        # Non-blocking: usage since the previous call instead of sleeping for a second
+        cpu_usage = psutil.cpu_percent(interval=None)
         memory = psutil.virtual_memory()
-        self.memory_usage = memory.percent
-        self.neural_engine = min(self.cpu_usage * 1.2, 100)
-        self.temperature = 35 + (self.cpu_usage * 0.3)
+        self.app.call_from_thread(self._apply_metrics, cpu_usage, memory.percent)
+    
+    def _apply_metrics(self, cpu_usage: float, memory_usage: float) -> None:
+        """Set the reactive metrics from a snapshot"""
+        self.cpu_usage = cpu_usage
+        self.memory_usage = memory_usage
+        self.neural_engine = min(cpu_usage * 1.2, 100)
+        self.temperature = 35 + (cpu_usage * 0.3)
     
     def watch_cpu_usage(self, cpu_usage: float) -> None:
         """Called when cpu_usage changes"""
@@ -148,13 +166,17 @@ class ToolsWidget(Static):
 class StatusWidget(Static):
     """Widget for displaying system status"""
     
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._boot_time = psutil.boot_time()
+    
     def compose(self) -> ComposeResult:
         yield Label("ℹ️ System Status", classes="header")
-        yield Label(f"Platform: {platform.system()} {platform.release()}", id="platform")
-        yield Label(f"Architecture: {platform.machine()}", id="architecture")
-        yield Label(f"Python: {platform.python_version()}", id="python")
+        yield Label(f"Platform: {_PLATFORM}", id="platform")
+        yield Label(f"Architecture: {_MACHINE}", id="architecture")
+        yield Label(f"Python: {_PYTHON_VERSION}", id="python")
         yield Label("Status: 🟢 Healthy", id="status")
-        yield Label(f"Uptime: {int(time.time() - psutil.boot_time()) // 3600}h", id="uptime")
+        yield Label(f"Uptime: {int(time.time() - self._boot_time) // 3600}h", id="uptime")
     
     def on_mount(self) -> None:
         """Called when widget is mounted"""
@@ -162,7 +184,7 @@ class StatusWidget(Static):
     
     def update_status(self) -> None:
         """Update system status"""
-        uptime_hours = int(time.time() - psutil.boot_time()) // 3600
+        uptime_hours = int(time.time() - self._boot_time) // 3600
         self.query_one("#uptime", Label).update(f"Uptime: {uptime_hours}h")
 
 class LogWidget(Static):
@@ -170,14 +192,16 @@ class LogWidget(Static):
     
     def compose(self) -> ComposeResult:
         yield Label("📝 Activity Log", classes="header")
-        yield TextArea("NeuralForge TUI started successfully!\n", id="log-area", read_only=True)
+        # Append-only and capped, so adding a line never rebuilds the whole log
+        log_area = RichLog(id="log-area", max_lines=500)
+        log_area.write("NeuralForge TUI started successfully!")
+        yield log_area
     
     def add_log(self, message: str):
         """Add a log message"""
-        log_area = self.query_one("#log-area", TextArea)
+        log_area = self.query_one("#log-area", RichLog)
         timestamp = datetime.now().strftime("%H:%M:%S")
-        log_area.text += f"[{timestamp}] {message}\n"
-        log_area.scroll_end()
+        log_area.write(f"[{timestamp}] {message}")
 
 class NeuralForgeTUI(App):
     """Main TUI application"""
@@ -233,7 +257,7 @@ class NeuralForgeTUI(App):
         margin: 0 0 1 0;
     }
     
-    TextArea {
+    RichLog {
         height: 10;
     }
     """
@@ -4,6 +4,7 @@ Beautiful visual interface using Rich library
 """
 import time
 import asyncio
+import threading
 from datetime import datetime
 from rich.console import Console
 from rich.panel import Panel
@@ -30,6 +31,10 @@ class VisualTerminalDashboard:
         self.console = Console()
         self.running = False
         self.layout = Layout()
+        # Set by stop_dashboard to wake the refresh loop immediately
+        self._stop_event = threading.Event()
+        # Prime the CPU counters so later non-blocking reads cover the time since the previous call
+        psutil.cpu_percent(interval=None)
         
     def create_layout(self):
         """Create the main dashboard layout"""
@@ -71,7 +76,8 @@ class VisualTerminalDashboard:
     def create_metrics_panel(self) -> Panel:
         """Create system metrics panel"""
         # Get system metrics
-        cpu_percent = psutil.cpu_percent(interval=1)
+        # Non-blocking: a 1 s sampling window here would stall every refresh
+        cpu_percent = psutil.cpu_percent(interval=None)
         memory = psutil.virtual_memory()
         disk = psutil.disk_usage('/')
         
@@ -242,16 +248,25 @@ class VisualTerminalDashboard:
         self.create_layout()
         
         try:
-            with Live(self.layout, refresh_per_second=2, screen=True) as live:
+            # Redraw once per layout update instead of on a separate timer
+            with Live(self.layout, auto_refresh=False, screen=True) as live:
                 self.running = True
+                self._stop_event.clear()
                 while self.running:
                     self.update_layout()
-                    time.sleep(0.5)
+                    live.refresh()
+                    if self._stop_event.wait(0.5):
+                        break
                     
         except KeyboardInterrupt:
             self.running = False
             console.print("\n[yellow]👋 Dashboard closed. Goodbye![/yellow]")
     
+    def stop_dashboard(self):
+        """Stop the dashboard refresh loop"""
+        self.running = False
+        self._stop_event.set()
+    
     def show_interactive_menu(self):
         """Show interactive menu for tool selection"""
         while True:
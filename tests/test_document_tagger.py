@@ -0,0 +1,208 @@
+"""
+Tests for Document Tagger functionality
+"""
+import pytest
+import sys
+import tempfile
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from ai.document_tagger import DocumentTagger
+
+
+SAMPLE_TEXT = """
+This is a Python programming document about machine learning and AI.
+It covers topics like neural networks, deep learning, and data analysis.
+The document discusses various algorithms and their applications in business.
+"""
+
+
+class TestDocumentTagger:
+    """Test cases for DocumentTagger"""
+
+    def test_extract_keywords(self):
+        """Test keyword extraction"""
+        tagger = DocumentTagger()
+        keywords = tagger.extract_keywords("python python python code code data")
+
+        assert keywords[0] == "python"
+        assert keywords[1] == "code"
+        assert "the" not in keywords
+
+    def test_generate_tags(self):
+        """Test tag generation"""
+        tagger = DocumentTagger()
+        tags = tagger.generate_tags(SAMPLE_TEXT, "Python AI Guide")
+
+        assert "technical" in tags
+        assert "academic" in tags
+        assert len(tags) == len(set(tags))
+
+    def test_generate_tags_order(self):
+        """Test that categories come before keywords and ranking is kept"""
+        tagger = DocumentTagger()
+        tags = tagger.generate_tags("code code code budget budget zebra")
+
+        assert tags == ["technical", "business", "code", "budget", "zebra"]
+
+    def test_process_document(self):
+        """Test processing a single document"""
+        tagger = DocumentTagger()
+        with tempfile.TemporaryDirectory() as temp_dir:
+            doc_path = Path(temp_dir) / "guide.txt"
+            doc_path.write_text(SAMPLE_TEXT, encoding="utf-8")
+
+            result = tagger.process_document(str(doc_path))
+
+            assert 'error' not in result
+            assert result['title'] == "guide"
+            assert result['word_count'] == len(SAMPLE_TEXT.split())
+            assert result['sentence_count'] == 3
+
+    def test_process_document_read_cap(self):
+        """Test that only the head of large files is read"""
+        tagger = DocumentTagger(max_read_bytes=11)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            doc_path = Path(temp_dir) / "big.txt"
+            # The cap falls inside the two-byte 'é'
+            doc_path.write_text("code code é trailing words", encoding="utf-8")
+
+            result = tagger.process_document(str(doc_path))
+
+            assert 'error' not in result
+            assert result['word_count'] == 2
+            assert result['file_size_bytes'] > 11
+
+    def test_process_binary_document(self):
+        """Test that binary files are rejected without decoding"""
+        tagger = DocumentTagger()
+        with tempfile.TemporaryDirectory() as temp_dir:
+            doc_path = Path(temp_dir) / "data.json"
+            doc_path.write_bytes(b"PK\x03\x04\x00\x00binary payload")
+
+            assert tagger.process_document(str(doc_path)) == {'error': 'Binary file'}
+
+    def test_process_latin1_document(self):
+        """Test that non-UTF-8 text falls back to latin-1"""
+        tagger = DocumentTagger()
+        with tempfile.TemporaryDirectory() as temp_dir:
+            doc_path = Path(temp_dir) / "notes.txt"
+            doc_path.write_bytes("café research".encode("latin-1"))
+
+            result = tagger.process_document(str(doc_path))
+
+            assert 'error' not in result
+            assert "café" in result['keywords']
+
+    def test_search_documents(self):
+        """Test relevance-ranked document search"""
+        tagger = DocumentTagger()
+        documents = [
+            {'title': 'notes', 'keywords': ['python'], 'tags': ['technical']},
+            {'title': 'python guide', 'keywords': ['python', 'code'], 'tags': ['python']},
+            {'title': 'budget', 'keywords': ['money'], 'tags': ['business']},
+        ]
+
+        results = tagger.search_documents(documents, "Python")
+
+        assert [doc['title'] for doc in results] == ['python guide', 'notes']
+        assert results[0]['relevance_score'] == 6
+        assert results[1]['relevance_score'] == 2
+
+        # A prebuilt index gives the same answer
+        index = tagger.build_index(documents)
+        assert tagger.search_documents(documents, "python", index=index) == results
+
+        # Only the top_n best matches are returned
+        assert tagger.search_documents(documents, "python", top_n=1) == results[:1]
+
+    def test_process_missing_document(self):
+        """Test processing a document that does not exist"""
+        tagger = DocumentTagger()
+        result = tagger.process_document("/nonexistent/file.txt")
+        assert 'error' in result
+
+
+class TestProcessDirectory:
+    """Test cases for DocumentTagger.process_directory"""
+
+    def _make_tree(self, root: Path):
+        (root / "nested").mkdir()
+        (root / "a.txt").write_text(SAMPLE_TEXT, encoding="utf-8")
+        (root / "b.md").write_text("Meeting notes about the budget.", encoding="utf-8")
+        (root / "nested" / "c.py").write_text("def code(): pass", encoding="utf-8")
+        (root / "skip.bin").write_bytes(b"\x00\x01\x02")
+
+    @pytest.mark.parametrize("max_workers", [1, 2])
+    def test_process_directory(self, max_workers):
+        """Test serial and parallel directory processing give the same summary"""
+        tagger = DocumentTagger()
+        with tempfile.TemporaryDirectory() as temp_dir:
+            self._make_tree(Path(temp_dir))
+
+            results = tagger.process_directory(temp_dir, max_workers=max_workers)
+
+            assert 'error' not in results
+            assert results['total_files'] == 3
+            assert results['processed_files'] == 3
+            assert results['failed_files'] == 0
+            assert results['summary']['file_types'] == {'.txt': 1, '.md': 1, '.py': 1}
+            assert sum(results['summary']['readability_distribution'].values()) == 3
+
+    @pytest.mark.parametrize("max_workers", [1, 2])
+    def test_process_directory_summary_only(self, max_workers):
+        """Test summary-only mode matches the full summary without documents"""
+        tagger = DocumentTagger()
+        with tempfile.TemporaryDirectory() as temp_dir:
+            self._make_tree(Path(temp_dir))
+
+            full = tagger.process_directory(temp_dir, max_workers=1)
+            compact = tagger.process_directory(
+                temp_dir, max_workers=max_workers, summary_only=True
+            )
+
+            assert compact['documents'] == []
+            assert compact['processed_files'] == full['processed_files']
+            assert compact['summary']['total_words'] == full['summary']['total_words']
+            assert compact['summary']['file_types'] == full['summary']['file_types']
+            assert set(compact['summary']['total_tags']) == set(full['summary']['total_tags'])
+            assert (compact['summary']['readability_distribution']
+                    == full['summary']['readability_distribution'])
+
+    def test_process_directory_cache(self):
+        """Test that unchanged files are served from the cache"""
+        tagger = DocumentTagger()
+        with tempfile.TemporaryDirectory() as temp_dir, \
+                tempfile.TemporaryDirectory() as cache_dir:
+            root = Path(temp_dir)
+            self._make_tree(root)
+            cache_path = str(Path(cache_dir) / "cache.json")
+
+            first = tagger.process_directory(temp_dir, max_workers=1, cache_path=cache_path)
+            (root / "b.md").write_text("Changed research notes.", encoding="utf-8")
+
+            processed = []
+            original = tagger.process_document
+
+            def tracking_process_document(file_path, stat=None):
+                processed.append(Path(file_path).name)
+                return original(file_path, stat)
+
+            tagger.process_document = tracking_process_document
+            second = tagger.process_directory(temp_dir, max_workers=1, cache_path=cache_path)
+
+            assert processed == ["b.md"]
+            assert second['processed_files'] == first['processed_files'] == 3
+            assert "academic" in second['summary']['total_tags']
+
+    def test_process_missing_directory(self):
+        """Test processing a directory that does not exist"""
+        tagger = DocumentTagger()
+        results = tagger.process_directory("/nonexistent/directory")
+        assert results == {'error': 'Directory does not exist'}
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
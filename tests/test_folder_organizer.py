@@ -0,0 +1,268 @@
+"""
+Tests for File Organizer functionality
+"""
+import hashlib
+import json
+import os
+import pytest
+import sys
+import tempfile
+import time
+from pathlib import Path
+from unittest import mock
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from core import folder_organizer
+from core.folder_organizer import FileOrganizer
+
+
+def _make_tree(root: Path):
+    (root / "nested" / "deeper").mkdir(parents=True)
+    (root / "photo.JPG").write_bytes(b"x" * 10)
+    (root / "notes.txt").write_text("hello", encoding="utf-8")
+    (root / "nested" / "notes.txt").write_text("world", encoding="utf-8")
+    (root / "nested" / "deeper" / "script.py").write_text("print()", encoding="utf-8")
+    (root / "README").write_text("no extension", encoding="utf-8")
+
+
+class TestAnalyzeDirectory:
+    """Test cases for FileOrganizer.analyze_directory"""
+
+    @pytest.mark.parametrize("max_workers", [1, 4])
+    def test_analyze_directory(self, max_workers):
+        """Test serial and threaded walks count sizes and file types across nested directories"""
+        organizer = FileOrganizer()
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            _make_tree(root)
+            old = time.time() - 30 * 24 * 3600
+            os.utime(root / "README", (old, old))
+
+            analysis = organizer.analyze_directory(temp_dir, max_workers=max_workers)
+
+            assert 'error' not in analysis
+            assert analysis['total_files'] == 5
+            assert analysis['total_size_mb'] == pytest.approx(39 / (1024 * 1024))
+            assert analysis['file_types'] == {'.jpg': 1, '.txt': 2, '.py': 1, '': 1}
+            assert len(analysis['recent_files']) == 4
+            assert analysis['large_files'] == []
+
+    @pytest.mark.parametrize("max_workers", [1, 4])
+    def test_duplicates_by_content(self, max_workers):
+        """Test that only files with identical contents are reported as duplicates"""
+        organizer = FileOrganizer()
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            _make_tree(root)
+            # Same size as notes.txt but different contents, and a renamed copy
+            (root / "nested" / "copy of notes.txt").write_text("hello", encoding="utf-8")
+            (root / "nested" / "deeper" / "again.txt").write_text("hello", encoding="utf-8")
+            (root / "empty1").touch()
+            (root / "empty2").touch()
+
+            duplicates = organizer.analyze_directory(temp_dir, max_workers=max_workers)['duplicates']
+
+            assert len(duplicates) == 2
+            assert {frozenset(d['files']) for d in duplicates} <= {
+                frozenset({str(root / "notes.txt"), str(root / "nested" / "copy of notes.txt")}),
+                frozenset({str(root / "notes.txt"), str(root / "nested" / "deeper" / "again.txt")}),
+                frozenset({str(root / "nested" / "copy of notes.txt"),
+                           str(root / "nested" / "deeper" / "again.txt")}),
+            }
+            assert all(d['hash'] == duplicates[0]['hash'] for d in duplicates)
+            assert duplicates[0]['hash'] == hashlib.sha256(b"hello").hexdigest()
+
+    def test_hash_file_mapped_and_chunked(self):
+        """Test that memory-mapped and chunked hashing give the same digest"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            data = os.urandom(3 * 1024 * 1024 + 7)
+            path = Path(temp_dir) / "medium.bin"
+            path.write_bytes(data)
+
+            assert folder_organizer._hash_file(str(path)) == hashlib.sha256(data).hexdigest()
+            with mock.patch.object(folder_organizer.mmap, 'mmap', side_effect=OSError):
+                assert folder_organizer._hash_file(str(path)) == hashlib.sha256(data).hexdigest()
+
+    def test_duplicates_with_other_hash_algorithm(self):
+        """Test that the content hash algorithm is configurable"""
+        organizer = FileOrganizer(hash_algorithm='blake2b')
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            (root / "a.bin").write_bytes(b"same")
+            (root / "b.bin").write_bytes(b"same")
+
+            duplicates = organizer.analyze_directory(temp_dir)['duplicates']
+
+            assert [d['hash'] for d in duplicates] == [hashlib.blake2b(b"same").hexdigest()]
+
+        with pytest.raises(ValueError):
+            FileOrganizer(hash_algorithm='not-a-hash')
+
+    def test_large_files_and_streamed_output(self):
+        """Test the bounded large-file list and streaming records to a JSON Lines file"""
+        organizer = FileOrganizer()
+        with tempfile.TemporaryDirectory() as temp_dir, \
+                tempfile.TemporaryDirectory() as output_dir:
+            root = Path(temp_dir)
+            _make_tree(root)
+            # Sparse files report a large size without using disk space
+            for name, size_mb in (("a.iso", 150), ("b.iso", 300), ("c.iso", 200)):
+                with open(root / name, 'wb') as f:
+                    f.truncate(size_mb * 1024 * 1024)
+            output_path = Path(output_dir) / "analysis.jsonl"
+
+            analysis = organizer.analyze_directory(
+                temp_dir, output_path=str(output_path), max_large_files=2
+            )
+
+            assert [Path(f['path']).name for f in analysis['large_files']] == ["b.iso", "c.iso"]
+            assert analysis['large_files'][0]['size_mb'] == 300
+            assert analysis['recent_files'] == []
+
+            records = [json.loads(line) for line in output_path.read_text().splitlines()]
+            assert sum(r['type'] == 'large' for r in records) == 3
+            assert sum(r['type'] == 'recent' for r in records) == analysis['total_files'] == 8
+
+    def test_duplicate_hash_cache(self, monkeypatch):
+        """Test that a second run only hashes files whose size or mtime changed"""
+        with tempfile.TemporaryDirectory() as temp_dir, \
+                tempfile.TemporaryDirectory() as cache_dir:
+            root = Path(temp_dir)
+            _make_tree(root)
+            cache_path = str(Path(cache_dir) / "hashes.json")
+            first = FileOrganizer().analyze_directory(temp_dir, max_workers=1,
+                                                      cache_path=cache_path)
+            (root / "nested" / "notes.txt").write_text("hello", encoding="utf-8")
+            later = time.time() + 10
+            os.utime(root / "nested" / "notes.txt", (later, later))
+
+            hashed = []
+            original = folder_organizer._hash_file
+
+            def tracking_hash_file(path, algorithm='sha256'):
+                hashed.append(Path(path).relative_to(root).as_posix())
+                return original(path, algorithm)
+
+            monkeypatch.setattr(folder_organizer, '_hash_file', tracking_hash_file)
+            second = FileOrganizer().analyze_directory(temp_dir, max_workers=1,
+                                                       cache_path=cache_path)
+
+            assert first['duplicates'] == []
+            assert hashed == ["nested/notes.txt"]
+            assert [sorted(d['files']) for d in second['duplicates']] == [
+                sorted([str(root / "notes.txt"), str(root / "nested" / "notes.txt")])
+            ]
+
+    @pytest.mark.parametrize("max_workers", [1, 4])
+    def test_ignored_and_hidden_directories(self, max_workers):
+        """Test that ignored and hidden directories are skipped unless configured otherwise"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            _make_tree(root)
+            for directory in (".git/objects", "nested/__pycache__", ".cache", "node_modules"):
+                (root / directory).mkdir(parents=True)
+                (root / directory / "skipped.py").write_text("x", encoding="utf-8")
+            (root / ".hidden_file.txt").write_text("kept", encoding="utf-8")
+
+            default = FileOrganizer().analyze_directory(temp_dir, max_workers=max_workers)
+            everything = FileOrganizer(ignore=(), skip_hidden=False).analyze_directory(
+                temp_dir, max_workers=max_workers
+            )
+            custom = FileOrganizer(ignore={"nested"}).analyze_directory(
+                temp_dir, max_workers=max_workers
+            )
+
+            assert default['total_files'] == 6
+            assert default['file_types']['.py'] == 1
+            assert everything['total_files'] == 10
+            # A custom set replaces the defaults, so node_modules is walked again
+            assert custom['total_files'] == 5
+
+    def test_analyze_missing_directory(self):
+        """Test analyzing a directory that does not exist"""
+        organizer = FileOrganizer()
+        assert organizer.analyze_directory("/nonexistent/directory") == {
+            'error': 'Directory does not exist'
+        }
+
+
+
+class TestOrganizeFiles:
+    """Test cases for FileOrganizer.organize_files and create_organization_plan"""
+
+    def test_get_file_category(self):
+        """Test extension lookup, including the extension shared by two categories"""
+        organizer = FileOrganizer()
+
+        assert organizer._get_file_category("Report.PDF") == 'documents'
+        assert organizer._get_file_category("table.csv") == 'data'
+        assert organizer._get_file_category("archive.tar.gz") == 'archives'
+        assert organizer._get_file_category("README") is None
+
+    def test_organize_files_dry_run(self):
+        """Test that a dry run plans moves for top-level files only"""
+        organizer = FileOrganizer()
+        with tempfile.TemporaryDirectory() as temp_dir, \
+                tempfile.TemporaryDirectory() as target_dir:
+            _make_tree(Path(temp_dir))
+
+            results = organizer.organize_files(temp_dir, target_dir)
+
+            assert results['files_processed'] == 3
+            assert results['files_moved'] == 2
+            assert results['files_skipped'] == 1
+            assert {op['category'] for op in results['operations']} == {'images', 'documents'}
+            assert all(op['status'] == 'would_move' for op in results['operations'])
+            assert (Path(temp_dir) / "photo.JPG").exists()
+
+    def test_organize_files_moves_and_renames(self):
+        """Test that files are moved and name conflicts get a numeric suffix"""
+        organizer = FileOrganizer()
+        with tempfile.TemporaryDirectory() as temp_dir, \
+                tempfile.TemporaryDirectory() as target_dir:
+            _make_tree(Path(temp_dir))
+            (Path(target_dir) / "documents").mkdir()
+            (Path(target_dir) / "documents" / "notes.txt").write_text("existing", encoding="utf-8")
+
+            results = organizer.organize_files(temp_dir, target_dir, dry_run=False)
+
+            assert results['files_moved'] == 2
+            assert (Path(target_dir) / "images" / "photo.JPG").exists()
+            assert (Path(target_dir) / "documents" / "notes_1.txt").read_text() == "hello"
+            assert not (Path(temp_dir) / "notes.txt").exists()
+
+    def test_organize_files_case_only_conflict(self):
+        """Test that names differing only in case count as a conflict"""
+        organizer = FileOrganizer()
+        with tempfile.TemporaryDirectory() as temp_dir, \
+                tempfile.TemporaryDirectory() as target_dir:
+            (Path(temp_dir) / "report.pdf").write_text("new", encoding="utf-8")
+            (Path(target_dir) / "documents").mkdir()
+            (Path(target_dir) / "documents" / "Report.PDF").write_text("existing", encoding="utf-8")
+
+            results = organizer.organize_files(temp_dir, target_dir, dry_run=False)
+
+            assert results['files_moved'] == 1
+            assert (Path(target_dir) / "documents" / "Report.PDF").read_text() == "existing"
+            assert (Path(target_dir) / "documents" / "report_1.pdf").read_text() == "new"
+
+    def test_create_organization_plan(self):
+        """Test that the plan groups top-level files by category"""
+        organizer = FileOrganizer()
+        with tempfile.TemporaryDirectory() as temp_dir:
+            _make_tree(Path(temp_dir))
+
+            plan = organizer.create_organization_plan(temp_dir)
+
+            assert plan['total_files'] == 5
+            assert plan['categories'] == {
+                'images': {'count': 1, 'size_mb': 10 / (1024 * 1024)},
+                'documents': {'count': 1, 'size_mb': 5 / (1024 * 1024)}
+            }
+            assert plan['recommendations'] == []
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
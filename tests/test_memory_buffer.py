@@ -104,6 +104,83 @@ class TestSimpleMemoryBuffer:
         finally:
             os.unlink(temp_path)
     
+    def test_query_memory_scoring(self):
+        """Test relevance scores across task, response and agent fields"""
+        with tempfile.NamedTemporaryFile(suffix='.json', delete=False) as f:
+            temp_path = f.name
+        
+        try:
+            buffer = SimpleMemoryBuffer(temp_path)
+            buffer.add_memory_entry(MemoryEntry("Agent1", "Python task", "Done", 5))
+            buffer.add_memory_entry(MemoryEntry("PythonBot", "Other", "Used PYTHON", 4))
+            buffer.add_memory_entry(MemoryEntry("Agent3", "Unrelated", "Nothing", 3))
+            buffer.close()
+            
+            for memory_buffer in (buffer, SimpleMemoryBuffer(temp_path)):
+                results = memory_buffer.query_memory("python")
+                assert [r['agent_name'] for r in results] == ["Agent1", "PythonBot"]
+                assert [r['relevance_score'] for r in results] == [0.5, 0.5]
+        finally:
+            os.unlink(temp_path)
+    
+    def test_query_memory_multiple_terms(self):
+        """Test that a field matches when it contains any word of the query"""
+        with tempfile.NamedTemporaryFile(suffix='.json', delete=False) as f:
+            temp_path = f.name
+        
+        try:
+            buffer = SimpleMemoryBuffer(temp_path)
+            buffer.add_memory_entry(MemoryEntry("Agent1", "System check", "Healthy", 5))
+            buffer.add_memory_entry(MemoryEntry("Agent2", "Log review", "Analysis (done)", 4))
+            buffer.add_memory_entry(MemoryEntry("Agent3", "Unrelated", "Nothing", 3))
+            
+            results = buffer.query_memory("system  ANALYSIS")
+            assert [r['agent_name'] for r in results] == ["Agent1", "Agent2"]
+            assert [r['relevance_score'] for r in results] == [0.5, 0.25]
+            
+            # Regex metacharacters in the query are matched literally
+            assert [r['agent_name'] for r in buffer.query_memory("(done) x.y")] == ["Agent2"]
+            buffer.close()
+        finally:
+            os.unlink(temp_path)
+    
+    def test_query_memory_cache(self):
+        """Test that cached query results keep their own scores and see new entries"""
+        with tempfile.NamedTemporaryFile(suffix='.json', delete=False) as f:
+            temp_path = f.name
+        
+        try:
+            buffer = SimpleMemoryBuffer(temp_path)
+            buffer.add_memory_entry(MemoryEntry("Agent1", "Python task", "Uses code", 5))
+            
+            assert buffer.query_memory("python")[0]['relevance_score'] == 0.5
+            assert buffer.query_memory("code")[0]['relevance_score'] == 0.25
+            # Served from the cache, with the score of this query restored
+            assert buffer.query_memory("Python")[0]['relevance_score'] == 0.5
+            
+            buffer.add_memory_entry(MemoryEntry("Agent2", "More python", "Done", 4))
+            assert len(buffer.query_memory("python")) == 2
+            buffer.close()
+        finally:
+            os.unlink(temp_path)
+    
+    def test_query_memory_sees_later_inserts(self):
+        """Test that entries added after a query are lowercased and searchable"""
+        with tempfile.NamedTemporaryFile(suffix='.json', delete=False) as f:
+            temp_path = f.name
+        
+        try:
+            buffer = SimpleMemoryBuffer(temp_path)
+            buffer.add_memory_entry(MemoryEntry("Agent1", "Deploy service", "OK", 5))
+            assert len(buffer.query_memory("deploy")) == 1
+            
+            buffer.add_memory_entry(MemoryEntry("Agent2", "DEPLOY database", "OK", 4))
+            results = buffer.query_memory("Deploy")
+            assert [r['agent_name'] for r in results] == ["Agent1", "Agent2"]
+            buffer.close()
+        finally:
+            os.unlink(temp_path)
+    
     def test_get_memory_stats(self):
         """Test memory statistics"""
         with tempfile.NamedTemporaryFile(suffix='.json', delete=False) as f:
@@ -128,6 +205,139 @@ class TestSimpleMemoryBuffer:
             
         finally:
             os.unlink(temp_path)
+    
+    def test_persistence_appends_lines(self):
+        """Test that entries are appended as JSON Lines and reloaded"""
+        with tempfile.NamedTemporaryFile(suffix='.json', delete=False) as f:
+            temp_path = f.name
+        
+        try:
+            buffer = SimpleMemoryBuffer(temp_path)
+            buffer.add_memory_entry(MemoryEntry("Agent1", "Task1", "Response1", 5))
+            buffer.add_memory_entry(MemoryEntry("Agent2", "Task2", "Response2", 4))
+            buffer.close()
+            
+            assert len(Path(temp_path).read_bytes().splitlines()) == 2
+            
+            reloaded = SimpleMemoryBuffer(temp_path)
+            assert [m['id'] for m in reloaded.memories] == [1, 2]
+            assert reloaded.memories[1]['agent_name'] == "Agent2"
+            
+            reloaded.add_memory_entry(MemoryEntry("Agent3", "Task3", "Response3", 3))
+            reloaded.close()
+            assert reloaded.memories[-1]['id'] == 3
+        finally:
+            os.unlink(temp_path)
+    
+    def test_torn_tail_is_repaired_on_load(self):
+        """Test that an append after a torn trailing line survives a reload"""
+        with tempfile.NamedTemporaryFile(suffix='.json', delete=False) as f:
+            temp_path = f.name
+        
+        try:
+            buffer = SimpleMemoryBuffer(temp_path)
+            buffer.add_memory_entry(MemoryEntry("Agent1", "Task1", "Response1", 5))
+            buffer.close()
+            with open(temp_path, 'ab') as f:
+                f.write(b'{"id": 2, "agent_na')
+            
+            buffer = SimpleMemoryBuffer(temp_path)
+            buffer.add_memory_entry(MemoryEntry("Agent2", "Task2", "Response2", 4))
+            buffer.close()
+            
+            reloaded = SimpleMemoryBuffer(temp_path)
+            assert [m['agent_name'] for m in reloaded.memories] == ["Agent1", "Agent2"]
+            reloaded.close()
+            
+            # A complete last record that only lacks its newline is kept
+            with open(temp_path, 'rb+') as f:
+                f.truncate(os.fstat(f.fileno()).st_size - 1)
+            buffer = SimpleMemoryBuffer(temp_path)
+            buffer.add_memory_entry(MemoryEntry("Agent3", "Task3", "Response3", 3))
+            buffer.close()
+            
+            reloaded = SimpleMemoryBuffer(temp_path)
+            assert [m['agent_name'] for m in reloaded.memories] == ["Agent1", "Agent2", "Agent3"]
+        finally:
+            os.unlink(temp_path)
+    
+    def test_compact_rewrites_storage(self):
+        """Test that compaction rewrites storage and later appends still persist"""
+        with tempfile.NamedTemporaryFile(suffix='.json', delete=False) as f:
+            temp_path = f.name
+        
+        try:
+            buffer = SimpleMemoryBuffer(temp_path, fsync=True)
+            buffer.add_memory_entry(MemoryEntry("Agent1", "Task1", "Response1", 5))
+            buffer.close()
+            with open(temp_path, 'ab') as f:
+                f.write(b'{"id": 2, "agent_na')
+            
+            buffer = SimpleMemoryBuffer(temp_path)
+            buffer.add_memory_entry(MemoryEntry("Agent2", "Task2", "Response2", 4))
+            assert buffer.compact()
+            assert not Path(temp_path + '.tmp').exists()
+            
+            buffer.add_memory_entry(MemoryEntry("Agent3", "Task3", "Response3", 3))
+            buffer.close()
+            
+            assert len(Path(temp_path).read_bytes().splitlines()) == 3
+            reloaded = SimpleMemoryBuffer(temp_path)
+            assert [m['agent_name'] for m in reloaded.memories] == ["Agent1", "Agent2", "Agent3"]
+        finally:
+            os.unlink(temp_path)
+    
+    def test_legacy_json_array_is_migrated(self):
+        """Test loading a storage file written as a single JSON array"""
+        with tempfile.NamedTemporaryFile('w', suffix='.json', delete=False) as f:
+            f.write('[\n  {"id": 1, "agent_name": "Legacy", "task": "t", "response": "r",'
+                    ' "success_rating": 5, "model_used": "unknown", "tokens_used": 0,'
+                    ' "metadata": {}, "timestamp": "2024-01-01T00:00:00"}\n]')
+            temp_path = f.name
+        
+        try:
+            buffer = SimpleMemoryBuffer(temp_path)
+            assert len(buffer.memories) == 1
+            assert buffer.memories[0]['agent_name'] == "Legacy"
+            assert not Path(temp_path).read_bytes().startswith(b'[')
+            
+            # Integer timestamps are backfilled so date ranges mix old and new entries
+            buffer.add_memory_entry(MemoryEntry("Agent2", "Task2", "Response2", 4))
+            date_range = buffer.get_memory_stats()['date_range']
+            assert date_range['oldest'] == "2024-01-01T00:00:00"
+            assert date_range['newest'] == buffer.memories[1]['timestamp']
+            buffer.close()
+        finally:
+            os.unlink(temp_path)
+    
+    def test_msgpack_storage(self):
+        """Test MessagePack storage, migration from JSON and torn-tail recovery"""
+        pytest.importorskip("msgpack")
+        with tempfile.TemporaryDirectory() as temp_dir:
+            json_path = Path(temp_dir) / "memories.json"
+            msgpack_path = Path(temp_dir) / "memories.msgpack"
+            
+            json_buffer = SimpleMemoryBuffer(str(json_path))
+            json_buffer.add_memory_entry(MemoryEntry("Agent1", "Task1", "Response1", 5))
+            json_buffer.close()
+            
+            buffer = SimpleMemoryBuffer(str(msgpack_path))
+            assert [m['agent_name'] for m in buffer.memories] == ["Agent1"]
+            buffer.add_memory_entry(MemoryEntry("Agent2", "Task2", "Response2", 4,
+                                                metadata={1: "int key"}))
+            buffer.close()
+            
+            # Simulate a write interrupted halfway through a third memory
+            with open(msgpack_path, 'ab') as f:
+                f.write(b'\x89\xa2id\x03')
+            
+            reloaded = SimpleMemoryBuffer(str(msgpack_path))
+            assert [m['id'] for m in reloaded.memories] == [1, 2]
+            assert reloaded.memories[1]['metadata'] == {1: "int key"}
+            reloaded.add_memory_entry(MemoryEntry("Agent3", "Task3", "Response3", 3))
+            reloaded.close()
+            
+            assert [m['id'] for m in SimpleMemoryBuffer(str(msgpack_path)).memories] == [1, 2, 3]
 
 
 class TestConfigurableMemoryBuffer:
@@ -186,6 +396,24 @@ class TestConfigurableMemoryBuffer:
         assert isinstance(stats, dict)
         assert 'total_entries' in stats
         assert 'avg_success_rating' in stats
+    
+    def test_add_memory_entries_and_has_entries(self):
+        """Test batch inserts and the cheap non-empty check"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            buffer = ConfigurableMemoryBuffer(config_override={
+                'fallback': {'storage_path': os.path.join(temp_dir, 'memories.json')}
+            })
+            assert buffer.has_entries() is False
+            
+            result = buffer.add_memory_entries([
+                {'agent_name': "Agent", 'task': f"Task {i}", 'response': "Done",
+                 'success_rating': 4}
+                for i in range(3)
+            ])
+            
+            assert result is True
+            assert buffer.has_entries() is True
+            assert buffer.get_memory_stats()['total_entries'] == 3
 
 
 if __name__ == "__main__":
@@ -0,0 +1,205 @@
+"""
+Tests for Natural Language Interface functionality
+"""
+import asyncio
+import pytest
+import sys
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from nlp.natural_language_interface import Command, NaturalLanguageProcessor
+
+
+class TestParseCommand:
+    """Test cases for NaturalLanguageProcessor.parse_command"""
+
+    def test_patterns_are_compiled(self):
+        """Test that command patterns are compiled once, case-insensitively"""
+        processor = NaturalLanguageProcessor()
+
+        for patterns in processor.command_patterns.values():
+            assert all(not isinstance(pattern, str) for pattern in patterns)
+        assert processor.command_patterns['monitor_system'][0].search("MONITOR MY MAC")
+
+    @pytest.mark.parametrize("user_input, action", [
+        ("Organize my downloads", "organize_files"),
+        ("monitor my system", "monitor_system"),
+        ("show my ai memory", "ai_memory"),
+        ("how many files have i organized", "analytics"),
+        ("what can you do", "help"),
+        ("automate this task", "schedule_task"),
+    ])
+    def test_parse_action(self, user_input, action):
+        """Test that phrases map to their actions"""
+        processor = NaturalLanguageProcessor()
+        assert processor.parse_command(user_input).action == action
+
+    def test_parse_pattern_priority(self):
+        """Test that the first pattern in table order wins, not the leftmost match"""
+        processor = NaturalLanguageProcessor()
+
+        command = processor.parse_command("remind me to email bob")
+
+        assert command.action == "email_automation"
+        assert command.target == "bob"
+
+    @pytest.mark.parametrize("user_input", ["help", " Commands ", "options"])
+    def test_parse_keyword_fast_path(self, user_input):
+        """Test that single-word commands resolve without the regex pass"""
+        processor = NaturalLanguageProcessor()
+        expected = processor.parse_command(f"{user_input} please")
+
+        processor._combined_pattern = None
+        command = processor.parse_command(user_input)
+
+        assert command.action == expected.action == "help"
+        assert command.confidence == expected.confidence
+
+    def test_parse_targets_and_parameters(self):
+        """Test target capture and parameter extraction"""
+        processor = NaturalLanguageProcessor()
+
+        scrape = processor.parse_command("scrape the website https://news.com/a")
+        assert scrape.target == "https://news.com/a"
+        assert scrape.parameters == {'url': 'https://news.com/a'}
+
+        email = processor.parse_command("send an email to john@company.com")
+        assert email.parameters == {'recipient': 'john@company.com'}
+
+        task = processor.parse_command("schedule a task for backup at 3 pm")
+        assert task.target == "backup at 3 pm"
+        assert task.parameters == {'time': '3', 'task': 'backup at 3 pm'}
+
+    def test_parse_defaults(self):
+        """Test default parameters when nothing is given"""
+        processor = NaturalLanguageProcessor()
+
+        assert processor.parse_command("web scrape example.com").parameters == {
+            'url': 'https://example.com'
+        }
+        assert processor.parse_command("clean up the files in ~/work").parameters == {
+            'target': '~/Downloads'
+        }
+
+    def test_parse_cache(self, monkeypatch):
+        """Test that repeated phrases skip parsing and the cache stays bounded"""
+        processor = NaturalLanguageProcessor()
+        first = processor.parse_command("Organize my downloads")
+        first.parameters['target'] = "changed"
+
+        monkeypatch.setattr(processor, "_parse_normalized", None)
+        second = processor.parse_command("  organize MY downloads ")
+
+        assert second == processor.parse_command("organize my downloads")
+        assert second.parameters == {'target': '~/Downloads'}
+
+        monkeypatch.undo()
+        for i in range(300):
+            processor.parse_command(f"remind me to stretch {i}")
+        assert len(processor._parse_cache) == 256
+        assert "organize my downloads" not in processor._parse_cache
+
+    def test_parse_unknown(self):
+        """Test that unrecognised input gives no command"""
+        processor = NaturalLanguageProcessor()
+        assert processor.parse_command("gibberish text") is None
+
+
+class TestExecuteCommand:
+    """Test cases for NaturalLanguageProcessor.execute_command"""
+
+    def test_execute_in_process(self, tmp_path, monkeypatch):
+        """Test that a tool's main() runs in-process with its output captured"""
+        (tmp_path / "fake_nlp_tool.py").write_text(
+            "import sys\n"
+            "def main():\n"
+            "    print('organized', sys.argv[1:])\n"
+            "    if '--fail' in sys.argv:\n"
+            "        print('bad target', file=sys.stderr)\n"
+            "        sys.exit(2)\n",
+            encoding="utf-8",
+        )
+        monkeypatch.syspath_prepend(str(tmp_path))
+        monkeypatch.setattr(sys, "argv", ["nlp", "--unrelated"])
+        processor = NaturalLanguageProcessor()
+        processor.tool_mappings["tidy_files"] = "fake_nlp_tool"
+
+        success, message = processor.execute_command(
+            Command("tidy_files", "", {'target': '~/Desktop'}, 0.8)
+        )
+        assert success
+        assert "organized ['--target', '~/Desktop']" in message
+        assert "fake_nlp_tool" in sys.modules
+
+        success, message = processor.execute_command(
+            Command("tidy_files", "", {'fail': 'yes'}, 0.8)
+        )
+        assert not success
+        assert message.endswith("bad target\n")
+        assert sys.argv == ["nlp", "--unrelated"]
+
+    def test_execute_async_streams_output(self, tmp_path, monkeypatch):
+        """Test that async commands stream lines from a subprocess and time out"""
+        (tmp_path / "fake_nlp_monitor.py").write_text(
+            "import sys, time\n"
+            "print('sample', sys.argv[1:], flush=True)\n"
+            "print('done', flush=True)\n"
+            "if '--slow' in sys.argv:\n"
+            "    time.sleep(30)\n",
+            encoding="utf-8",
+        )
+        monkeypatch.syspath_prepend(str(tmp_path))
+        processor = NaturalLanguageProcessor()
+        processor.tool_mappings["monitor_system"] = "fake_nlp_monitor"
+        streamed = []
+
+        success, message = asyncio.run(processor.execute_command_async(
+            Command("monitor_system", "", {'rate': '1'}, 0.8), on_output=streamed.append
+        ))
+        assert success
+        assert streamed == ["sample ['--rate', '1']", "done"]
+        assert message.endswith("done\n")
+
+        success, message = asyncio.run(processor.execute_command_async(
+            Command("monitor_system", "", {'slow': 'yes'}, 0.8), timeout=1
+        ))
+        assert (success, message) == (False, "❌ Monitor System timed out")
+
+        # Tools that run in-process synchronously get their own process here too
+        processor.tool_mappings["tidy_files"] = "fake_nlp_monitor"
+        streamed.clear()
+        success, message = asyncio.run(processor.execute_command_async(
+            Command("tidy_files", "", {}, 0.8), on_output=streamed.append, timeout=1
+        ))
+        assert success
+        assert streamed == ["sample []", "done"]
+        assert "fake_nlp_monitor" not in sys.modules
+
+    def test_built_in_tools_run_with_timeout(self, monkeypatch):
+        """Test that every built-in tool runs in a subprocess bounded by the timeout"""
+        processor = NaturalLanguageProcessor()
+        calls = []
+        monkeypatch.setattr(processor, "_run_tool", lambda *args: calls.append("in-process"))
+        monkeypatch.setattr(processor, "_run_tool_subprocess",
+                            lambda *args: calls.append("subprocess") or (True, ""))
+
+        for action in processor.tool_mappings:
+            if action != "help":
+                assert processor.execute_command(Command(action, "", {}, 0.8))[0]
+
+        assert calls == ["subprocess"] * (len(processor.tool_mappings) - 1)
+
+    def test_execute_help_and_unknown(self):
+        """Test the built-in help and unknown actions"""
+        processor = NaturalLanguageProcessor()
+
+        assert processor.execute_command(Command("help", "", {}, 0.7))[0]
+        assert processor.execute_command(Command("dance", "", {}, 0.7)) == (
+            False, "Unknown action: dance"
+        )
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
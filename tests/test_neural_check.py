@@ -1,13 +1,18 @@
 """
 Tests for Neural Engine monitoring functionality
 """
+import plistlib
 import pytest
 import sys
+import threading
+import time
 from pathlib import Path
+from unittest import mock
 
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
+from core import neural_check
 from core.neural_check import NeuralEngineMonitor
 
 
@@ -54,6 +59,50 @@ class TestNeuralEngineMonitor:
         metrics = monitor.get_system_metrics()
         assert isinstance(metrics, dict)
     
+    def test_gpu_usage_from_plist(self):
+        """Test parsing GPU usage from a powermetrics plist sample"""
+        sample = plistlib.dumps({'gpu': {'idle_ratio': 0.75}}) + b'\x00'
+        assert neural_check._gpu_usage_from_plist(sample) == 25.0
+        assert neural_check._gpu_usage_from_plist(b'not a plist') is None
+    
+    def test_hardware_profile_is_probed_once(self):
+        """Test that system_profiler runs once per process"""
+        neural_check._hardware_profile.cache_clear()
+        try:
+            with mock.patch.object(neural_check.subprocess, 'run',
+                                   return_value=mock.Mock(returncode=0, stdout="M3")) as run:
+                monitor = NeuralEngineMonitor()
+                assert monitor._get_ane_power() == monitor._get_ane_power() == 15.2
+                assert run.call_count == 1
+        finally:
+            neural_check._hardware_profile.cache_clear()
+    
+    def test_create_dashboard_reuses_layout(self):
+        """Test that dashboard refreshes rewrite the same layout in place"""
+        monitor = NeuralEngineMonitor()
+        first = monitor.create_dashboard({})
+        second = monitor.create_dashboard({'cpu_percent': 91.5, 'gpu_usage': 12.0})
+        
+        assert second is first
+        assert monitor._metric_cells['cpu'][0].plain == "91.5%"
+        assert monitor._metric_cells['cpu'][1].plain == "🔴"
+        assert monitor._metric_cells['gpu'][0].plain == "12.0%"
+        assert monitor._metric_cells['ane'][0].plain == "N/A"
+    
+    def test_stop_monitoring_wakes_refresh_loop(self):
+        """Test that stop_monitoring ends the loop without waiting out the refresh interval"""
+        monitor = NeuralEngineMonitor()
+        with mock.patch.object(neural_check._PowermetricsSampler, 'start'):
+            thread = threading.Thread(target=monitor.start_monitoring, args=(60,))
+            thread.start()
+            time.sleep(0.2)
+            started = time.monotonic()
+            monitor.stop_monitoring()
+            thread.join(timeout=5)
+        
+        assert not thread.is_alive()
+        assert time.monotonic() - started < 5
+    
     @pytest.mark.slow
     def test_monitoring_duration(self):
         """Test monitoring for a short duration"""
@@ -0,0 +1,193 @@
+"""
+Tests for System Integration functionality
+"""
+import os
+import pytest
+import sys
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from integration.system_integration import SystemIntegration
+
+
+LOGS = {
+    "2024-01-01.md": "CPU at 40% and memory 8 GB used",
+    "2024-01-02.md": "Neural Engine idle; model qwen loaded, phi pending",
+    "2024-01-03.md": "Nothing notable",
+}
+
+
+@pytest.fixture
+def integration(tmp_path, monkeypatch):
+    """A SystemIntegration whose memory file and logs live in a temporary directory"""
+    monkeypatch.chdir(tmp_path)
+    integration = SystemIntegration()
+    integration.logs_path = tmp_path / "Logs"
+    integration.logs_path.mkdir()
+    for offset, (name, content) in enumerate(LOGS.items()):
+        log_file = integration.logs_path / name
+        log_file.write_text(content, encoding="utf-8")
+        os.utime(log_file, (1_700_000_000 + offset, 1_700_000_000 + offset))
+    return integration
+
+
+class TestAnalyzePersonaLogs:
+    """Test cases for SystemIntegration.analyze_persona_logs"""
+
+    def test_analyze_persona_logs(self, integration):
+        """Test that the latest logs are parsed newest first and analyzed"""
+        # A directory is not a log; a hidden log still counts, as with glob("*.md")
+        (integration.logs_path / "archive.md").mkdir()
+        draft = integration.logs_path / ".draft.md"
+        draft.write_text("CPU", encoding="utf-8")
+        os.utime(draft, (1_600_000_000, 1_600_000_000))
+        analysis = integration.analyze_persona_logs()
+
+        assert 'error' not in analysis
+        assert analysis['logs_found'] == 4
+        assert [log['file_name'] for log in analysis['latest_logs']] == [
+            "2024-01-03.md", "2024-01-02.md", "2024-01-01.md", ".draft.md"
+        ]
+        assert analysis['system_health']['status'] == 'healthy'
+        assert analysis['system_health']['ai_models_loaded'] == 1
+        assert [model['name'] for model in analysis['ai_models']] == ['Qwen3', 'Phi-4']
+
+    def test_parse_log_file_reads_only_the_preview(self, integration):
+        """Test that large logs are previewed from their head and sized from stat"""
+        log_file = integration.logs_path / "large.md"
+        content = "é" * 499 + "x" * 100_000
+        log_file.write_text(content, encoding="utf-8")
+
+        log_data = integration._parse_log_file(log_file)
+
+        assert log_data['content_preview'] == content[:500] + "..."
+        assert log_data['content_length'] == log_data['file_size'] == len(content.encode("utf-8"))
+
+        short_file = integration.logs_path / "short.md"
+        short_file.write_text("é" * 10, encoding="utf-8")
+        assert integration._parse_log_file(short_file)['content_preview'] == "é" * 10
+
+    def test_unchanged_logs_are_not_reread(self, integration, monkeypatch):
+        """Test that a second analysis only reads logs whose mtime or size changed"""
+        first = integration.analyze_persona_logs()
+        changed = integration.logs_path / "2024-01-01.md"
+        changed.write_text("CPU at 90%", encoding="utf-8")
+        # Keep the original mtime so only the size change invalidates the cache
+        os.utime(changed, (1_700_000_000, 1_700_000_000))
+
+        opened = []
+        original_open = open
+
+        def tracking_open(file, *args, **kwargs):
+            opened.append(Path(file).name)
+            return original_open(file, *args, **kwargs)
+
+        monkeypatch.setattr("builtins.open", tracking_open)
+        second = integration.analyze_persona_logs()
+
+        assert opened == ["2024-01-01.md"]
+        assert second['latest_logs'][:2] == first['latest_logs'][:2]
+        assert second['latest_logs'][-1]['content_preview'] == "CPU at 90%"
+
+    def test_health_keywords_match_substring_checks(self, integration):
+        """Test that overlapping keywords are all detected, as separate substring tests would"""
+        logs = [{'file_name': "a.md", 'content_preview': "QWENEURAL MODEL"}]
+
+        health = integration._analyze_system_health(logs)
+
+        assert health['neural_engine'] == 'detected'
+        assert health['ai_models_loaded'] == 1
+        assert health['cpu_usage'] == 'unknown'
+        assert [model['name'] for model in integration._extract_ai_models(logs)] == ['Qwen3']
+
+    def test_extract_ai_models_reports_first_detection(self, integration):
+        """Test that each model is reported once, from the first log mentioning it"""
+        logs = [
+            {'file_name': "new.md", 'content_preview': "gemma and phi"},
+            {'file_name': "old.md", 'content_preview': "qwen, phi and gemma"},
+        ]
+
+        models = integration._extract_ai_models(logs)
+
+        assert [(m['name'], m['detected_in']) for m in models] == [
+            ('Phi-4', "new.md"), ('Gemma', "new.md"), ('Qwen3', "old.md")
+        ]
+
+    def test_run_full_integration(self, integration):
+        """Test that the stored analysis is counted by the status that follows it"""
+        result = integration.run_full_integration()
+
+        assert result['success'] is True
+        assert result['memory_stored'] is True
+        assert result['status']['memory_entries'] == 1
+        assert result['status']['memory_system_status'] == 'active'
+        assert 'cpu_percent' in result['status']['system_metrics']
+
+    def test_batched_memory_writes(self, integration):
+        """Test that analyses are queued until the batch fills or is flushed"""
+        integration.memory_batch_size = 2
+        analysis = integration.analyze_persona_logs()
+
+        assert integration.store_analysis_in_memory(analysis) is True
+        assert integration.memory.get_memory_stats()['total_entries'] == 0
+        assert integration.store_analysis_in_memory(analysis) is True
+        assert integration.memory.get_memory_stats()['total_entries'] == 2
+
+        integration.store_analysis_in_memory(analysis)
+        integration.close()
+        assert integration.memory.get_memory_stats()['total_entries'] == 3
+
+    def test_failed_flush_keeps_batch(self, integration, monkeypatch):
+        """Test that a failed write leaves the batch queued for the next flush"""
+        integration.memory_batch_size = 5
+        analysis = integration.analyze_persona_logs()
+        integration.store_analysis_in_memory(analysis)
+        integration.store_analysis_in_memory(analysis)
+
+        def failing_write(entries):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(integration.memory, 'add_memory_entries', failing_write)
+        assert integration.flush_memory() is False
+        assert len(integration._memory_batch) == 2
+
+        monkeypatch.undo()
+        assert integration.flush_memory() is True
+        assert integration._memory_batch == []
+        assert integration.memory.get_memory_stats()['total_entries'] == 2
+
+    def test_integration_status_snapshot(self, integration, monkeypatch):
+        """Test that status is reused within the TTL and refreshed after a memory write"""
+        calls = []
+        original = integration.neural_monitor.get_system_metrics
+
+        def counting_metrics():
+            calls.append(1)
+            return original()
+
+        monkeypatch.setattr(integration.neural_monitor, 'get_system_metrics', counting_metrics)
+        integration.status_ttl = 60
+
+        first = integration.get_integration_status()
+        first['memory_entries'] = -1
+        second = integration.get_integration_status()
+
+        assert len(calls) == 1
+        assert second['memory_entries'] == 0
+
+        integration.store_analysis_in_memory(integration.analyze_persona_logs())
+        assert integration.get_integration_status()['memory_entries'] == 1
+        assert len(calls) == 2
+
+    def test_missing_logs_directory(self, integration, tmp_path):
+        """Test analyzing when the logs directory does not exist"""
+        integration.logs_path = tmp_path / "missing"
+        assert integration.analyze_persona_logs() == {
+            'error': 'PERSONA logs directory not found'
+        }
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])